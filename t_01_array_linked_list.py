@@ -0,0 +1,492 @@
+"""
+Module for an array-backed LinkedList with the same API as t_01_linked_list.
+
+Instead of one Python object per node, the list keeps its payloads and
+"next" links in contiguous buffers and addresses nodes by slot index.
+Deleted slots are chained into a free list and reused by later inserts.
+"""
+import argparse
+import operator
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from t_01_linked_list import LinkedList, LinkedListBase, _identity
+
+# Slot index that marks the end of a chain (the array analogue of None)
+NIL = -1
+
+
+class ArrayLinkedList(LinkedListBase):
+    """
+    Represents a singly linked list stored in parallel arrays.
+
+    Nodes are slot indices: search_element returns one and insert_after
+    accepts one. With typecode (e.g. 'q' or 'd') the payloads are kept in
+    an array of that type as well, otherwise in a Python list.
+    """
+    def __init__(self, data: list = None, typecode: str = None):
+        """
+        Initialize the ArrayLinkedList, optionally with a list of data.
+
+        Items are prepended one by one, so the resulting list holds them
+        in reverse order, exactly like LinkedList.
+        """
+        self.head = NIL
+        self.tail = NIL
+        self._length = 0
+        self._free = NIL
+        self._data = array(typecode) if typecode else []
+        self._next = array('q')
+        if data:
+            for i in data:
+                self.insert_at_beginning(i)
+
+    def __len__(self):
+        """
+        Return the number of nodes in the list.
+        """
+        return self._length
+
+    def __iter__(self):
+        """
+        Iterate over the data of the list from head to tail.
+        """
+        values, links = self._data, self._next
+        current = self.head
+        while current != NIL:
+            yield values[current]
+            current = links[current]
+
+    def _alloc(self, data) -> int:
+        """
+        Take a slot from the free list (or grow the buffers) and store data in it.
+        """
+        slot = self._free
+        if slot != NIL:
+            self._free = self._next[slot]
+            self._data[slot] = data
+            self._next[slot] = NIL
+        else:
+            slot = len(self._next)
+            self._data.append(data)
+            self._next.append(NIL)
+        return slot
+
+    def _release(self, slot: int):
+        """
+        Return a slot to the free list.
+        """
+        self._next[slot] = self._free
+        self._free = slot
+        if isinstance(self._data, list):
+            self._data[slot] = None
+
+    def get(self, slot: int):
+        """
+        Return the data stored in the given slot.
+        """
+        return self._data[slot]
+
+    def insert_at_end(self, data):
+        """
+        Insert a new node with the given data at the end of the list.
+        """
+        slot = self._alloc(data)
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+        self.tail = slot
+        self._length += 1
+
+    def insert_at_beginning(self, data):
+        """
+        Insert a new node with the given data at the beginning of the list.
+        """
+        slot = self._alloc(data)
+        self._next[slot] = self.head
+        self.head = slot
+        if self.tail == NIL:
+            self.tail = slot
+        self._length += 1
+
+    def extend(self, iterable):
+        """
+        Append every item of the iterable to the end of the list.
+
+        While the free list is empty the items are written to the end of
+        the buffers in a single bulk operation.
+        """
+        if self._free != NIL:
+            for item in iterable:
+                self.insert_at_end(item)
+            return
+        items = list(iterable)
+        if not items:
+            return
+        start = len(self._next)
+        self._data.extend(items)
+        self._next.extend(range(start + 1, start + len(items)))
+        self._next.append(NIL)
+        if self.tail == NIL:
+            self.head = start
+        else:
+            self._next[self.tail] = start
+        self.tail = start + len(items) - 1
+        self._length += len(items)
+
+    def insert_after(self, prev_node: int, data):
+        """
+        Insert a new node with the given data after the slot prev_node.
+        """
+        if prev_node is None or prev_node == NIL:
+            print("Попереднього вузла не існує.")
+            return
+        slot = self._alloc(data)
+        self._next[slot] = self._next[prev_node]
+        self._next[prev_node] = slot
+        if prev_node == self.tail:
+            self.tail = slot
+        self._length += 1
+
+    def search_element(self, data) -> int | None:
+        """
+        Search for the slot of the first node containing the specific data.
+        """
+        values, links = self._data, self._next
+        cur = self.head
+        while cur != NIL:
+            if values[cur] == data:
+                return cur
+            cur = links[cur]
+        return None
+
+    def delete_node(self, key: int):
+        """
+        Delete the first node with the specified key (data).
+        """
+        values, links = self._data, self._next
+        prev = NIL
+        cur = self.head
+        while cur != NIL and values[cur] != key:
+            prev = cur
+            cur = links[cur]
+        if cur == NIL:
+            return
+        if prev == NIL:
+            self.head = links[cur]
+        else:
+            links[prev] = links[cur]
+        if cur == self.tail:
+            self.tail = prev
+        self._length -= 1
+        self._release(cur)
+
+    def print_list(self):
+        """
+        Print the elements of the list.
+        """
+        self.write_to(sys.stdout)
+
+    def reverse(self):
+        """
+        Reverse the linked list in place.
+        """
+        links = self._next
+        prev = NIL
+        current = self.head
+        self.tail = current
+        while current != NIL:
+            next_node = links[current]
+            links[current] = prev
+            prev = current
+            current = next_node
+        self.head = prev
+
+    def sort_by_bubble(self, reverse=False, key=None):
+        """
+        Sort the linked list using bubble sort algorithm.
+        """
+        if self.head == NIL:
+            return
+        key = key or _identity
+        before = operator.gt if reverse else operator.lt
+        values, links = self._data, self._next
+        step = 1
+        last_step = float('inf')
+        while step < last_step:
+            prev = self.head
+            next_node = links[prev]
+            while next_node != NIL and step < last_step:
+                if before(key(values[next_node]), key(values[prev])):
+                    values[prev], values[next_node] = values[next_node], values[prev]
+                prev, next_node = next_node, links[next_node]
+                step += 1
+            last_step, step = step - 1, 1
+
+    def sort_by_insertion(self, reverse=False, key=None):
+        """
+        Sort the linked list using insertion sort algorithm.
+
+        Like LinkedList.sort_by_insertion, the search resumes from the
+        previously inserted node whenever possible.
+        """
+        if self.head == NIL or self._next[self.head] == NIL:
+            return
+
+        key = key or _identity
+        before = operator.gt if reverse else operator.lt
+        values, links = self._data, self._next
+        sorted_head = self.head
+        sorted_tail = self.head
+        last_inserted = self.head
+        current = links[self.head]
+        links[sorted_head] = NIL
+
+        while current != NIL:
+            next_node = links[current]
+            current_key = key(values[current])
+            if before(current_key, key(values[sorted_head])):
+                links[current] = sorted_head
+                sorted_head = current
+            else:
+                if before(current_key, key(values[last_inserted])):
+                    search = sorted_head
+                else:
+                    search = last_inserted
+                while links[search] != NIL \
+                        and not before(current_key, key(values[links[search]])):
+                    search = links[search]
+                links[current] = links[search]
+                links[search] = current
+                if search == sorted_tail:
+                    sorted_tail = current
+            last_inserted = current
+            current = next_node
+
+        self.head = sorted_head
+        self.tail = sorted_tail
+
+    def sort_by_merge(self, reverse=False, key=None):
+        """
+        Sort the linked list using bottom-up (iterative) merge sort.
+        """
+        if self.head == NIL or self._next[self.head] == NIL:
+            return
+
+        new_head = NIL
+        width = 1
+        while width < self._length:
+            new_head = prev_tail = NIL
+            current = self.head
+            while current != NIL:
+                left = current
+                right = self._split(left, width)
+                current = self._split(right, width)
+                merged_head, merged_tail = self._merge(left, right, reverse, key)
+                if prev_tail == NIL:
+                    new_head = merged_head
+                else:
+                    self._next[prev_tail] = merged_head
+                prev_tail = merged_tail
+            self.head = new_head
+            width *= 2
+
+        self.tail = prev_tail
+
+    def _sort_with_timsort(self, reverse, key):
+        """
+        Sort the payloads with the built-in Timsort and write them back
+        into the existing slots, so the links stay untouched.
+        """
+        values, links = self._data, self._next
+        slots = []
+        current = self.head
+        while current != NIL:
+            slots.append(current)
+            current = links[current]
+        buffer = sorted((values[slot] for slot in slots), key=key, reverse=reverse)
+        for slot, data in zip(slots, buffer):
+            values[slot] = data
+
+    def _split(self, head: int, size: int) -> int:
+        """
+        Cut the chain after the first size nodes and return the remainder.
+        """
+        links = self._next
+        for _ in range(size - 1):
+            if head == NIL:
+                break
+            head = links[head]
+        if head == NIL:
+            return NIL
+        rest = links[head]
+        links[head] = NIL
+        return rest
+
+    def _merge(self, a: int, b: int, reverse=False, key=None) -> tuple[int, int]:
+        """
+        Iteratively merge two sorted chains and return (head, tail) slots.
+
+        On equal keys nodes from a go first, which keeps the merge stable.
+        """
+        key = key or _identity
+        before = operator.gt if reverse else operator.lt
+        values, links = self._data, self._next
+        head = tail = NIL
+        if a != NIL and b != NIL:
+            key_a = key(values[a])
+            key_b = key(values[b])
+            while True:
+                took_b = before(key_b, key_a)
+                if took_b:
+                    taken = b
+                    b = links[b]
+                else:
+                    taken = a
+                    a = links[a]
+                if tail == NIL:
+                    head = taken
+                else:
+                    links[tail] = taken
+                tail = taken
+                if a == NIL or b == NIL:
+                    break
+                if took_b:
+                    key_b = key(values[b])
+                else:
+                    key_a = key(values[a])
+        rest = a if a != NIL else b
+        if tail == NIL:
+            head = rest
+        else:
+            links[tail] = rest
+        if rest != NIL:
+            tail = rest
+            while links[tail] != NIL:
+                tail = links[tail]
+        return head, tail
+
+    def sorted_merge(self, a: int, b: int, reverse=False, key=None) -> int:
+        """
+        Merge two sorted chains of this list and return the head slot.
+        """
+        return self._merge(a, b, reverse, key)[0]
+
+    def merge_sorted_lists(self, other_list: 'ArrayLinkedList',
+                           reverse: bool = False, key=None) -> None:
+        """
+        Merge another sorted ArrayLinkedList into this one.
+
+        The values of other_list are copied into this list's buffers and
+        other_list is left empty.
+        """
+        if other_list is self:
+            raise ValueError("cannot merge a list into itself")
+        other_head = NIL
+        other_tail = NIL
+        current = other_list.head
+        while current != NIL:
+            slot = self._alloc(other_list._data[current])
+            if other_tail == NIL:
+                other_head = slot
+            else:
+                self._next[other_tail] = slot
+            other_tail = slot
+            current = other_list._next[current]
+        self.head, self.tail = self._merge(self.head, other_head, reverse, key)
+        self._length += other_list._length
+        other_list.head = other_list.tail = other_list._free = NIL
+        other_list._length = 0
+        del other_list._data[:]
+        del other_list._next[:]
+
+
+def _measure(factory, size):
+    """
+    Build a list of size integers and return (bytes allocated, seconds per operation).
+    """
+    values = list(range(size))
+    random.Random(42).shuffle(values)
+
+    tracemalloc.start()
+    llist = factory()
+    llist.extend(values)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del llist
+
+    timings = {}
+    start = time.perf_counter()
+    llist = factory()
+    llist.extend(values)
+    timings['extend'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    llist.search_element(-1)
+    timings['search'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    llist.reverse()
+    timings['reverse'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    llist.sort()
+    timings['sort'] = time.perf_counter() - start
+    return memory, timings
+
+
+def benchmark(sizes=(10 ** 6, 10 ** 7)):
+    """
+    Compare memory and throughput of LinkedList and ArrayLinkedList.
+
+    Memory excludes the source list of integers, so for the Node-based and
+    list-backed variants it mostly reflects per-node overhead.
+    """
+    variants = {
+        'LinkedList': LinkedList,
+        'ArrayLinkedList': ArrayLinkedList,
+        "ArrayLinkedList('q')": lambda: ArrayLinkedList(typecode='q'),
+    }
+    print(f"{'size':>10} {'variant':<22} {'MB':>8} {'B/elem':>7} "
+          f"{'extend':>8} {'search':>8} {'reverse':>8} {'sort':>8}")
+    print("-" * 86)
+    for size in sizes:
+        for name, factory in variants.items():
+            memory, timings = _measure(factory, size)
+            print(f"{size:>10} {name:<22} {memory / 2 ** 20:>8.1f} {memory / size:>7.1f} "
+                  f"{timings['extend']:>8.3f} {timings['search']:>8.3f} "
+                  f"{timings['reverse']:>8.3f} {timings['sort']:>8.3f}")
+
+
+def main(argv=None):
+    """
+    Runs the demo, and with --benchmark also the comparison with LinkedList.
+    """
+    parser = argparse.ArgumentParser(description="Array-backed linked list demo.")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="compare memory and speed with LinkedList")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 6, 10 ** 7],
+                        help="list sizes for --benchmark")
+    args = parser.parse_args(argv)
+
+    llist = ArrayLinkedList([25, 20, 5, 10, 15])
+    print("Зв'язний список на масивах:")
+    llist.print_list()
+
+    llist.delete_node(5)
+    llist.insert_after(llist.search_element(10), 12)
+    llist.sort_by_merge()
+    print("Після видалення, вставки та сортування злиттям:")
+    llist.print_list()
+
+    if args.benchmark:
+        print("\nПорівняння з LinkedList:")
+        benchmark(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,30 @@
 """
 Module for LinkedList implementation and sorting algorithms.
 """
+import operator
+import sys
+from array import array
+from itertools import islice
+
+# Lists up to this length are always sorted by insertion sort in sort()
+INSERTION_SORT_THRESHOLD = 32
+# Maximum number of out-of-order neighbours for a list to count as nearly sorted
+NEARLY_SORTED_DESCENTS = 8
+
+
+def _identity(value):
+    """
+    Default sort key: compare the node data itself.
+    """
+    return value
 
 
 class Node:
     """
     Represents a node in a singly linked list.
     """
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None):
         """
         Initialize the Node with data and a pointer to the next node.
@@ -15,38 +33,226 @@ class Node:
         self.next = None
 
 
-class LinkedList:
+class LinkedListBase:
+    """
+    Behaviour shared by the linked list implementations.
+
+    Everything here works through __iter__ and __len__; subclasses provide
+    those plus sort_by_insertion and _sort_with_timsort.
+    """
+    def __reversed__(self):
+        """
+        Iterate over the data of the list from tail to head.
+        """
+        return reversed(self.to_list())
+
+    def to_list(self) -> list:
+        """
+        Export the data of the list into a Python list.
+        """
+        return list(self)
+
+    def to_array(self, typecode: str = 'q') -> array:
+        """
+        Export the data of the list into a typed array.array.
+        """
+        return array(typecode, self)
+
+    def map(self, func):
+        """
+        Lazily yield func(data) for every node.
+        """
+        for data in self:
+            yield func(data)
+
+    def filter(self, predicate):
+        """
+        Lazily yield the data of the nodes that satisfy predicate.
+        """
+        for data in self:
+            if predicate(data):
+                yield data
+
+    def take(self, n: int):
+        """
+        Lazily yield the data of at most the first n nodes.
+        """
+        return islice(self, n)
+
+    def write_to(self, fileobj, sep: str = " -> "):
+        """
+        Format the whole list and write it to fileobj in a single write call.
+        """
+        fileobj.write("".join(f"{data}{sep}" for data in self) + "\n")
+
+    def sort(self, reverse=False, key=None) -> str:
+        """
+        Sort the linked list, choosing the strategy from its size and order.
+
+        Small or nearly sorted lists are sorted in place by insertion sort;
+        anything else is copied into a Python list, sorted with the built-in
+        Timsort and written back into the existing nodes.
+
+        Returns:
+            str: the strategy that ran, "insertion" or "timsort".
+        """
+        key = key or _identity
+        if len(self) <= INSERTION_SORT_THRESHOLD \
+                or self._count_descents(reverse, key) <= NEARLY_SORTED_DESCENTS:
+            self.sort_by_insertion(reverse, key)
+            return "insertion"
+        self._sort_with_timsort(reverse, key)
+        return "timsort"
+
+    def _count_descents(self, reverse, key) -> int:
+        """
+        Count adjacent pairs that are out of order, stopping early once the
+        list can no longer be considered nearly sorted.
+        """
+        before = operator.gt if reverse else operator.lt
+        descents = 0
+        keys = map(key, self)
+        prev_key = next(keys)
+        for current_key in keys:
+            if before(current_key, prev_key):
+                descents += 1
+                if descents > NEARLY_SORTED_DESCENTS:
+                    break
+            prev_key = current_key
+        return descents
+
+
+class LinkedList(LinkedListBase):
     """
     Represents a singly linked list.
     """
-    def __init__(self, data: list = None):
+    node_class = Node
+
+    def __init__(self, data: list = None, indexed: bool = False):
         """
         Initialize the LinkedList, optionally with a list of data.
+
+        Items are prepended one by one, so the resulting list holds them
+        in reverse order. With indexed=True the list also keeps a
+        value -> nodes hash index, which makes membership tests and lookups
+        O(1) on average; the data must then be hashable.
         """
         self.head = None
+        self.tail = None
+        self._length = 0
+        self._index = {} if indexed else None
         if data:
             for i in data:
                 self.insert_at_beginning(i)
 
+    def __len__(self):
+        """
+        Return the number of nodes in the list.
+        """
+        return self._length
+
+    def __iter__(self):
+        """
+        Iterate over the data of the list from head to tail.
+        """
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __contains__(self, data):
+        """
+        Check whether any node holds the given data.
+        """
+        if self._index is not None:
+            return data in self._index
+        return self.search_element(data) is not None
+
+    @property
+    def indexed(self) -> bool:
+        """
+        Whether the list maintains a value -> nodes hash index.
+        """
+        return self._index is not None
+
+    def _index_add(self, node: Node):
+        """
+        Register a node in the hash index.
+        """
+        bucket = self._index.get(node.data)
+        if bucket is None:
+            self._index[node.data] = {node: None}
+        else:
+            bucket[node] = None
+
+    def _index_remove(self, node: Node):
+        """
+        Drop a node from the hash index.
+        """
+        bucket = self._index[node.data]
+        del bucket[node]
+        if not bucket:
+            del self._index[node.data]
+
+    def _rebuild_index(self):
+        """
+        Rebuild the hash index after data has been moved between nodes.
+        """
+        if self._index is None:
+            return
+        self._index = {}
+        current = self.head
+        while current:
+            self._index_add(current)
+            current = current.next
+
     def insert_at_end(self, data):
         """
         Insert a new node with the given data at the end of the list.
         """
-        if not self.head:
-            self.head = Node(data)
+        new_node = self.node_class(data)
+        if self.tail is None:
+            self.head = new_node
         else:
-            cur = self.head
-            while cur.next:
-                cur = cur.next
-            cur.next = Node(data)
+            self.tail.next = new_node
+        self.tail = new_node
+        self._length += 1
+        if self._index is not None:
+            self._index_add(new_node)
 
     def insert_at_beginning(self, data):
         """
         Insert a new node with the given data at the beginning of the list.
         """
-        new_node = Node(data)
+        new_node = self.node_class(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._length += 1
+        if self._index is not None:
+            self._index_add(new_node)
+
+    def extend(self, iterable):
+        """
+        Append every item of the iterable to the end of the list in one pass.
+        """
+        node_class = self.node_class
+        index_add = self._index_add if self._index is not None else None
+        tail = self.tail
+        count = 0
+        for item in iterable:
+            new_node = node_class(item)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+            if index_add:
+                index_add(new_node)
+        self.tail = tail
+        self._length += count
 
     def insert_after(self, prev_node: Node, data):
         """
@@ -55,14 +261,30 @@ class LinkedList:
         if prev_node is None:
             print("Попереднього вузла не існує.")
             return
-        new_node = Node(data)
+        new_node = self.node_class(data)
         new_node.next = prev_node.next
         prev_node.next = new_node
+        if prev_node is self.tail:
+            self.tail = new_node
+        self._length += 1
+        if self._index is not None:
+            self._index_add(new_node)
 
     def search_element(self, data) -> Node | None:
         """
         Search for a node containing the specific data.
         """
+        if self._index is not None:
+            bucket = self._index.get(data)
+            if not bucket:
+                return None
+            if len(bucket) == 1:
+                return next(iter(bucket))
+            # Several equal values: the first one in list order wins
+            cur = self.head
+            while cur not in bucket:
+                cur = cur.next
+            return cur
         cur = self.head
         while cur:
             if cur.data == data:
@@ -74,9 +296,16 @@ class LinkedList:
         """
         Delete the first node with the specified key (data).
         """
+        if self._index is not None and key not in self._index:
+            return
         cur = self.head
         if cur and cur.data == key:
             self.head = cur.next
+            if self.head is None:
+                self.tail = None
+            self._length -= 1
+            if self._index is not None:
+                self._index_remove(cur)
             cur = None
             return
         prev = None
@@ -86,17 +315,18 @@ class LinkedList:
         if cur is None:
             return
         prev.next = cur.next
+        if cur is self.tail:
+            self.tail = prev
+        self._length -= 1
+        if self._index is not None:
+            self._index_remove(cur)
         cur = None
 
     def print_list(self):
         """
         Print the elements of the list.
         """
-        current = self.head
-        while current:
-            print(current.data, end=" -> ")
-            current = current.next
-        print()
+        self.write_to(sys.stdout)
 
     def reverse(self):
         """
@@ -104,6 +334,7 @@ class LinkedList:
         """
         prev = None
         current = self.head
+        self.tail = current
         while current:
             next_node = current.next
             current.next = prev
@@ -111,131 +342,337 @@ class LinkedList:
             current = next_node
         self.head = prev
 
-    def sort_by_bubble(self, reverse=False):
+    def sort_by_bubble(self, reverse=False, key=None):
         """
         Sort the linked list using bubble sort algorithm.
         """
+        if self.head is None:
+            return
+        key = key or _identity
+        before = operator.gt if reverse else operator.lt
         step = 1
         last_step = float('inf')
         while step < last_step:
             prev = self.head
             next_node = self.head.next
             while prev and next_node and step < last_step:
-                if (not reverse and next_node.data < prev.data) \
-                        or (reverse and next_node.data > prev.data):
+                if before(key(next_node.data), key(prev.data)):
                     prev.data, next_node.data = next_node.data, prev.data
                 prev, next_node = prev.next, next_node.next
                 step += 1
             last_step, step = step - 1, 1
+        self._rebuild_index()
 
-    def sort_by_insertion(self, reverse=False):
+    def sort_by_insertion(self, reverse=False, key=None):
         """
         Sort the linked list using insertion sort algorithm.
+
+        The search for the insertion point starts from the previously
+        inserted node whenever possible, so already sorted, reversed and
+        nearly sorted lists are handled in close to linear time.
         """
         if self.head is None or self.head.next is None:
             return
 
-        sorted_head = None
-        current = self.head
+        key = key or _identity
+        before = operator.gt if reverse else operator.lt
+        sorted_head = self.head
+        sorted_tail = self.head
+        last_inserted = self.head
+        current = self.head.next
+        sorted_head.next = None
 
         while current:
             next_node = current.next
-            if sorted_head is None:
+            current_key = key(current.data)
+            # Determine insertion point
+            if before(current_key, key(sorted_head.data)):
+                current.next = sorted_head
                 sorted_head = current
-                sorted_head.next = None
             else:
-                # Determine insertion point
-                if not reverse:
-                    if current.data < sorted_head.data:
-                        current.next = sorted_head
-                        sorted_head = current
-                    else:
-                        search = sorted_head
-                        while search.next and search.next.data <= current.data:
-                            search = search.next
-                        current.next = search.next
-                        search.next = current
+                if before(current_key, key(last_inserted.data)):
+                    search = sorted_head
                 else:
-                    if current.data > sorted_head.data:
-                        current.next = sorted_head
-                        sorted_head = current
-                    else:
-                        search = sorted_head
-                        while search.next and search.next.data >= current.data:
-                            search = search.next
-                        current.next = search.next
-                        search.next = current
+                    search = last_inserted
+                while search.next and not before(current_key, key(search.next.data)):
+                    search = search.next
+                current.next = search.next
+                search.next = current
+                if search is sorted_tail:
+                    sorted_tail = current
+            last_inserted = current
             current = next_node
 
         self.head = sorted_head
+        self.tail = sorted_tail
 
-    def sort_by_merge(self, reverse=False):
+    def sort_by_merge(self, reverse=False, key=None):
         """
-        Sort the linked list using merge sort algorithm.
+        Sort the linked list using bottom-up (iterative) merge sort.
+
+        Runs of width 1, 2, 4, ... are merged pairwise in place, so the
+        sort is stable, needs no recursion and only O(1) extra space.
         """
-        self.head = self._merge_sort(self.head, reverse)
+        if self.head is None or self.head.next is None:
+            return
 
-    def _merge_sort(self, head, reverse):
+        dummy = Node()
+        dummy.next = self.head
+        width = 1
+        while width < self._length:
+            prev_tail = dummy
+            current = dummy.next
+            while current:
+                left = current
+                right = self._split(left, width)
+                current = self._split(right, width)
+                merged_head, merged_tail = self._merge(left, right, reverse, key)
+                prev_tail.next = merged_head
+                prev_tail = merged_tail
+            width *= 2
+
+        self.head = dummy.next
+        self.tail = prev_tail
+
+    def _sort_with_timsort(self, reverse, key):
+        """
+        Copy the data into a Python list, sort it with the built-in Timsort
+        and write it back into the existing nodes.
+        """
+        buffer = []
+        current = self.head
+        while current:
+            buffer.append(current.data)
+            current = current.next
+        buffer.sort(key=key, reverse=reverse)
+        current = self.head
+        for data in buffer:
+            current.data = data
+            current = current.next
+        self._rebuild_index()
+
+    @staticmethod
+    def _split(head: Node, size: int) -> Node | None:
         """
-        Recursive helper function for merge sort.
+        Cut the chain after the first size nodes and return the remainder.
         """
-        if head is None or head.next is None:
-            return head
+        for _ in range(size - 1):
+            if head is None:
+                break
+            head = head.next
+        if head is None:
+            return None
+        rest = head.next
+        head.next = None
+        return rest
+
+    @staticmethod
+    def _merge(a: Node, b: Node, reverse=False,
+               key=None) -> tuple[Node | None, Node | None]:
+        """
+        Iteratively merge two sorted chains and return (head, tail) of the result.
+
+        On equal keys nodes from a go first, which keeps the merge stable.
+        """
+        key = key or _identity
+        before = operator.gt if reverse else operator.lt
+        dummy = Node()
+        tail = dummy
+        if a and b:
+            key_a = key(a.data)
+            key_b = key(b.data)
+            while True:
+                if before(key_b, key_a):
+                    tail.next = b
+                    tail = b
+                    b = b.next
+                    if b is None:
+                        break
+                    key_b = key(b.data)
+                else:
+                    tail.next = a
+                    tail = a
+                    a = a.next
+                    if a is None:
+                        break
+                    key_a = key(a.data)
+        tail.next = a if a else b
+        while tail.next:
+            tail = tail.next
+        if tail is dummy:
+            return None, None
+        return dummy.next, tail
+
+    def sorted_merge(self, a: Node, b: Node, reverse=False, key=None) -> Node:
+        """
+        Merge two sorted linked lists.
+        """
+        return self._merge(a, b, reverse, key)[0]
 
-        middle = self._get_middle(head)
-        next_to_middle = middle.next
-        middle.next = None
+    def merge_sorted_lists(self, other_list: 'LinkedList',
+                           reverse: bool = False, key=None) -> None:
+        """
+        Merge another sorted LinkedList into this one.
 
-        left = self._merge_sort(head, reverse)
-        right = self._merge_sort(next_to_middle, reverse)
+        The nodes of other_list are moved into this list, so other_list
+        is left empty.
+        """
+        if other_list is self:
+            raise ValueError("cannot merge a list into itself")
+        if self._index is not None:
+            current = other_list.head
+            while current:
+                self._index_add(current)
+                current = current.next
+        self.head, self.tail = self._merge(self.head, other_list.head, reverse, key)
+        self._length += other_list._length
+        other_list.head = None
+        other_list.tail = None
+        other_list._length = 0
+        if other_list._index is not None:
+            other_list._index = {}
+
+
+class DoublyNode(Node):
+    """
+    Represents a node in a doubly linked list.
+    """
+    __slots__ = ('prev',)
 
-        return self.sorted_merge(left, right, reverse)
+    def __init__(self, data=None):
+        """
+        Initialize the node with data and pointers to both neighbours.
+        """
+        super().__init__(data)
+        self.prev = None
+
+
+class DoublyLinkedList(LinkedList):
+    """
+    Represents a doubly linked list.
 
-    def _get_middle(self, head):
+    Nodes also point to their predecessor, so a node can be removed by
+    reference in O(1). Together with indexed=True this makes deleting the
+    first occurrence of a value O(1) on average.
+    """
+    node_class = DoublyNode
+
+    def insert_at_end(self, data):
         """
-        Find the middle node of the linked list.
+        Insert a new node with the given data at the end of the list.
         """
-        if head is None:
-            return head
-        slow = head
-        fast = head
-        while fast.next and fast.next.next:
-            slow = slow.next
-            fast = fast.next.next
-        return slow
+        prev_tail = self.tail
+        super().insert_at_end(data)
+        self.tail.prev = prev_tail
 
-    def sorted_merge(self, a: Node, b: Node, reverse=False) -> Node:
+    def insert_at_beginning(self, data):
         """
-        Merge two sorted linked lists.
+        Insert a new node with the given data at the beginning of the list.
         """
-        if a is None:
-            return b
-        if b is None:
-            return a
+        super().insert_at_beginning(data)
+        if self.head.next:
+            self.head.next.prev = self.head
 
-        if not reverse:
-            if a.data <= b.data:
-                result = a
-                result.next = self.sorted_merge(a.next, b, reverse)
-            else:
-                result = b
-                result.next = self.sorted_merge(a, b.next, reverse)
+    def extend(self, iterable):
+        """
+        Append every item of the iterable to the end of the list.
+        """
+        prev = self.tail
+        super().extend(iterable)
+        current = prev.next if prev else self.head
+        while current:
+            current.prev = prev
+            prev = current
+            current = current.next
+
+    def insert_after(self, prev_node: DoublyNode, data):
+        """
+        Insert a new node with the given data after the specified prev_node.
+        """
+        super().insert_after(prev_node, data)
+        if prev_node is None:
+            return
+        new_node = prev_node.next
+        new_node.prev = prev_node
+        if new_node.next:
+            new_node.next.prev = new_node
+
+    def remove_node(self, node: DoublyNode):
+        """
+        Unlink the given node from the list in O(1).
+        """
+        if node.prev:
+            node.prev.next = node.next
         else:
-            if a.data >= b.data:
-                result = a
-                result.next = self.sorted_merge(a.next, b, reverse)
-            else:
-                result = b
-                result.next = self.sorted_merge(a, b.next, reverse)
-        return result
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self._length -= 1
+        if self._index is not None:
+            self._index_remove(node)
+
+    def delete_node(self, key: int):
+        """
+        Delete the first node with the specified key (data).
+        """
+        node = self.search_element(key)
+        if node is not None:
+            self.remove_node(node)
+
+    def __reversed__(self):
+        """
+        Iterate over the data of the list from tail to head via prev pointers.
+        """
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+
+    def reverse(self):
+        """
+        Reverse the linked list in place by swapping both pointers of every node.
+        """
+        current = self.head
+        self.head, self.tail = self.tail, self.head
+        while current:
+            current.next, current.prev = current.prev, current.next
+            current = current.prev
+
+    def _link_prev(self):
+        """
+        Restore prev pointers after the chain has been relinked through next.
+        """
+        prev = None
+        current = self.head
+        while current:
+            current.prev = prev
+            prev = current
+            current = current.next
+
+    def sort_by_insertion(self, reverse=False, key=None):
+        """
+        Sort the linked list using insertion sort algorithm.
+        """
+        super().sort_by_insertion(reverse, key)
+        self._link_prev()
+
+    def sort_by_merge(self, reverse=False, key=None):
+        """
+        Sort the linked list using bottom-up (iterative) merge sort.
+        """
+        super().sort_by_merge(reverse, key)
+        self._link_prev()
 
     def merge_sorted_lists(self, other_list: 'LinkedList',
-                           reverse: bool = False) -> None:
+                           reverse: bool = False, key=None) -> None:
         """
         Merge another sorted LinkedList into this one.
         """
-        merged_head = self.sorted_merge(self.head, other_list.head, reverse)
-        self.head = merged_head
+        super().merge_sorted_lists(other_list, reverse, key)
+        self._link_prev()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,32 @@
 """
 This module recursively draws a Pythagoras tree using Matplotlib.
+
+Besides the recursive reference implementation, it provides a vectorized
+engine that computes whole tree levels at once with NumPy and renders
+them as a single LineCollection.
 """
+import argparse
 import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+
+# File extensions that are written as raster images
+RASTER_FORMATS = {'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.webp'}
+# Extensions whose imsave format name differs from the extension itself
+RASTER_FORMAT_ALIASES = {'.tif': 'tiff'}
+# Number of levels used to estimate the extent of the tree for level of detail
+LOD_ESTIMATE_DEPTH = 12
+# Number of segments drawn per artist when streaming onto a raster canvas
+RASTER_CHUNK_SIZE = 2 ** 16
 
 
 def get_line_length(p1, p2):
@@ -20,7 +44,7 @@ def get_next_point(p1, p2, angle):
     y = p2[1] + line_length * math.cos(radian_angle)
     return [x, y]
 
-def pythagoras_tree(p1, p2, depth, angle = 0):
+def pythagoras_tree(p1, p2, depth, angle = 0, branch_angle = 45, min_length = 0):
     """
     Recursively draws the Pythagoras tree.
     
@@ -29,31 +53,457 @@ def pythagoras_tree(p1, p2, depth, angle = 0):
         p2: End point of the current branch segment.
         depth: Current recursion depth.
         angle: Current angle of the branch.
+        branch_angle: Angle between a branch and each of its children.
+        min_length: Branches shorter than this are neither drawn nor subdivided.
     """
-    if depth > 0:
+    if depth > 0 and get_line_length(p1, p2) >= min_length:
         plt.plot([p1[0], p2[0]], [p1[1], p2[1]], color='blue')
         left_p1 = p2
-        left_p2 = get_next_point(p1, p2, angle + 45)
+        left_p2 = get_next_point(p1, p2, angle + branch_angle)
         right_p1 = p2
-        right_p2 = get_next_point(p1, p2, angle - 45)
-        pythagoras_tree(left_p1, left_p2, depth - 1, angle + 45)
-        pythagoras_tree(right_p1, right_p2, depth -1, angle - 45)
+        right_p2 = get_next_point(p1, p2, angle - branch_angle)
+        pythagoras_tree(left_p1, left_p2, depth - 1, angle + branch_angle,
+                        branch_angle, min_length)
+        pythagoras_tree(right_p1, right_p2, depth -1, angle - branch_angle,
+                        branch_angle, min_length)
+
+def _next_level(ends, angles, length, turn):
+    """
+    Computes the children of a batch of branches in one vectorized step.
+
+    Args:
+        ends: End points of the parent branches, shape (n, 2).
+        angles: Angles of the parent branches in radians, shape (n,).
+        length: Length of every child branch.
+        turn: Branch angle in radians.
+
+    Returns:
+        tuple: starts, ends and angles of the 2n children, left before right.
+    """
+    child_angles = np.empty(2 * len(angles))
+    child_angles[0::2] = angles + turn
+    child_angles[1::2] = angles - turn
+    starts = np.repeat(ends, 2, axis=0)
+    child_ends = starts + length * np.column_stack(
+        (np.sin(child_angles), np.cos(child_angles))
+    )
+    return starts, child_ends, child_angles
+
+def pythagoras_levels(p1, p2, depth, angle = 0, branch_angle = 45, min_length = 0):
+    """
+    Generates the Pythagoras tree level by level with NumPy.
+
+    All children of a level are computed in one batched operation, which
+    gives the same segments as pythagoras_tree without recursion.
+
+    Args:
+        p1: Start point of the trunk.
+        p2: End point of the trunk.
+        depth: Number of levels to generate.
+        angle: Angle of the trunk.
+        branch_angle: Angle between a branch and each of its children.
+        min_length: Generation stops at the first level whose branches
+                    are shorter than this (all branches of a level have
+                    the same length).
+
+    Yields:
+        np.ndarray: Segments of one level, shape (n, 2, 2), where each
+                    segment is [[x1, y1], [x2, y2]].
+    """
+    starts = np.array([p1], dtype=float)
+    ends = np.array([p2], dtype=float)
+    angles = np.array([math.radians(angle)])
+    length = get_line_length(p1, p2)
+    turn = math.radians(branch_angle)
+    for level in range(depth):
+        if length < min_length:
+            break
+        yield np.stack((starts, ends), axis=1)
+        if level == depth - 1:
+            break
+        length *= math.sqrt(2) / 2
+        starts, ends, angles = _next_level(ends, angles, length, turn)
+
+def pythagoras_chunks(p1, p2, depth, angle = 0, branch_angle = 45, chunk_size = 65536,
+                      min_length = 0):
+    """
+    Generates the Pythagoras tree in chunks of at most chunk_size segments.
+
+    Batches of branches are expanded depth-first and split in half once
+    they outgrow chunk_size, so memory stays bounded by about
+    depth * chunk_size segments regardless of the total tree size.
+    Branches shorter than min_length are not generated.
+
+    Yields:
+        np.ndarray: A chunk of segments, shape (n, 2, 2).
+    """
+    if depth <= 0:
+        return
+    turn = math.radians(branch_angle)
+    stack = [(
+        np.array([p1], dtype=float),
+        np.array([p2], dtype=float),
+        np.array([math.radians(angle)]),
+        get_line_length(p1, p2),
+        depth,
+    )]
+    while stack:
+        starts, ends, angles, length, levels_left = stack.pop()
+        if length < min_length:
+            continue
+        yield np.stack((starts, ends), axis=1)
+        if levels_left == 1:
+            continue
+        length *= math.sqrt(2) / 2
+        starts, ends, angles = _next_level(ends, angles, length, turn)
+        if len(angles) > chunk_size:
+            half = len(angles) // 2
+            stack.append((starts[half:], ends[half:], angles[half:], length, levels_left - 1))
+            stack.append((starts[:half], ends[:half], angles[:half], length, levels_left - 1))
+        else:
+            stack.append((starts, ends, angles, length, levels_left - 1))
+
+def pythagoras_segments(p1, p2, depth, angle = 0, branch_angle = 45, min_length = 0):
+    """
+    Computes every segment of the Pythagoras tree as one NumPy array.
+
+    Returns:
+        np.ndarray: Segments of all levels, shape (2 ** depth - 1, 2, 2)
+                    unless min_length cuts the tree short.
+    """
+    levels = list(pythagoras_levels(p1, p2, depth, angle, branch_angle, min_length))
+    if not levels:
+        return np.empty((0, 2, 2))
+    return np.concatenate(levels)
+
+def pythagoras_progressive(p1, p2, depth, angle = 0, branch_angle = 45, min_length = 0,
+                           max_segments = None, time_budget = None):
+    """
+    Yields successive depth levels until a segment or time budget runs out.
+
+    The caller can render each level as it arrives and simply stop
+    iterating once the picture is good enough.
+
+    Args:
+        max_segments: Stop before the level that would exceed this many
+                      segments in total.
+        time_budget: Stop once this many seconds have passed since the
+                     first level was requested.
+
+    Yields:
+        tuple: (level, segments) where segments has shape (2 ** level, 2, 2).
+    """
+    started = time.perf_counter()
+    total = 0
+    levels = pythagoras_levels(p1, p2, depth, angle, branch_angle, min_length)
+    for level, segments in enumerate(levels):
+        total += len(segments)
+        if max_segments is not None and total > max_segments:
+            return
+        yield level, segments
+        if time_budget is not None and time.perf_counter() - started >= time_budget:
+            return
+
+def lod_min_length(p1, p2, size, branch_angle = 45, min_pixels = 1.0):
+    """
+    Converts a pixel threshold into a branch length in data units.
+
+    The extent of the whole tree is estimated from its first levels, which
+    already span almost the final bounding box.
+
+    Args:
+        p1: Start point of the trunk.
+        p2: End point of the trunk.
+        size: Canvas width and height in pixels.
+        branch_angle: Angle between a branch and each of its children.
+        min_pixels: Shortest branch worth drawing, in pixels.
+    """
+    xmin, xmax, ymin, ymax = _chunks_bounds(
+        pythagoras_levels(p1, p2, LOD_ESTIMATE_DEPTH, branch_angle = branch_angle)
+    )
+    extent = max(xmax - xmin, ymax - ymin) * 1.1
+    return min_pixels * extent / size
+
+def _lod_depth(p1, p2, size, depth, branch_angle = 45, min_pixels = None):
+    """
+    Returns depth reduced to the last level whose branches are at least min_pixels long.
+
+    All branches of a level share one length, so level-of-detail culling
+    of a whole render comes down to capping the depth.
+    """
+    if min_pixels is None:
+        return depth
+    min_length = lod_min_length(p1, p2, size, branch_angle, min_pixels)
+    trunk = get_line_length(p1, p2)
+    while depth > 0 and trunk * (math.sqrt(2) / 2) ** (depth - 1) < min_length:
+        depth -= 1
+    return depth
 
-def draw_pythagoras_tree(size = 600, depth = 5):
+def _trunk(size):
+    """Returns the trunk end points used for a canvas of the given size."""
+    return (size/2, 10), (size/2, size / 2)
+
+def draw_pythagoras_tree(size = 600, depth = 5, branch_angle = 45, min_pixels = None):
     """
-    Initializes the plot and starts the recursive drawing of the Pythagoras tree.
+    Initializes the plot and draws the Pythagoras tree as one LineCollection.
     
     Args:
         size: Size parameter (used to determine initial trunk size).
         depth: Maximum recursion depth.
+        branch_angle: Angle between a branch and each of its children.
+        min_pixels: If set, branches shorter than this many pixels are skipped.
     """
-    plt.figure(figsize=(size/100, size/100))
-    pythagoras_tree(p1 = (size/2, 10), p2 = (size/2, size / 2), depth = depth)
+    _, ax = plt.subplots(figsize=(size/100, size/100))
+    p1, p2 = _trunk(size)
+    min_length = 0 if min_pixels is None \
+        else lod_min_length(p1, p2, size, branch_angle, min_pixels)
+    segments = pythagoras_segments(p1, p2, depth, branch_angle = branch_angle,
+                                   min_length = min_length)
+    ax.add_collection(LineCollection(segments, colors='blue'))
+    ax.autoscale_view()
     plt.axis('off')
     plt.show()
 
-def main():
-    """Main function to handle user input and draw the tree."""
+def _chunks_bounds(chunks):
+    """Returns (xmin, xmax, ymin, ymax) over an iterable of segment chunks."""
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+    for chunk in chunks:
+        points = chunk.reshape(-1, 2)
+        xmin, ymin = np.minimum((xmin, ymin), points.min(axis=0))
+        xmax, ymax = np.maximum((xmax, ymax), points.max(axis=0))
+    return xmin, xmax, ymin, ymax
+
+def render_pythagoras_tree(path, size = 600, depth = 5, branch_angle = 45,
+                           color = 'blue', raster_threshold = 2 ** 16, min_pixels = None):
+    """
+    Renders the Pythagoras tree to an image file without a GUI.
+
+    The output format follows the file extension (PNG, SVG, ...). The Agg
+    canvas is used directly, so no interactive backend is needed. Raster
+    outputs of trees with more than raster_threshold segments are drawn
+    chunk by chunk straight onto the canvas, so only one chunk of segments
+    exists as an artist at any time; for vector outputs such trees are
+    embedded as a rasterized layer.
+
+    Args:
+        path: Output file path.
+        size: Image width and height in pixels.
+        depth: Number of tree levels.
+        branch_angle: Angle between a branch and each of its children.
+        color: Line color.
+        raster_threshold: Segment count above which rasterization kicks in.
+        min_pixels: If set, branches shorter than this many pixels are skipped.
+    """
+    fig, canvas, ax = _new_canvas(size)
+    p1, p2 = _trunk(size)
+    depth = _lod_depth(p1, p2, size, depth, branch_angle, min_pixels)
+    segment_count = 2 ** depth - 1 if depth > 0 else 0
+    streaming = segment_count > raster_threshold \
+        and os.path.splitext(path)[1].lower() in RASTER_FORMATS
+
+    if not streaming:
+        segments = pythagoras_segments(p1, p2, depth, branch_angle = branch_angle)
+        collection = LineCollection(segments, colors=color)
+        collection.set_rasterized(segment_count > raster_threshold)
+        ax.add_collection(collection)
+        ax.autoscale_view()
+        fig.savefig(path)
+        return
+
+    bounds = _chunks_bounds(
+        pythagoras_chunks(p1, p2, depth, branch_angle = branch_angle,
+                          chunk_size = RASTER_CHUNK_SIZE)
+    )
+    chunks = pythagoras_chunks(p1, p2, depth, branch_angle = branch_angle,
+                               chunk_size = RASTER_CHUNK_SIZE)
+    _stream_chunks(canvas, ax, path, chunks, bounds, color)
+
+def _new_canvas(size):
+    """Creates an off-screen Agg figure with a single borderless axes."""
+    fig = Figure(figsize=(size/100, size/100), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.axis('off')
+    return fig, canvas, ax
+
+def _stream_chunks(canvas, ax, path, chunks, bounds, color):
+    """
+    Draws segment chunks one at a time onto the Agg canvas and saves the raster.
+
+    Every chunk becomes a temporary LineCollection that is drawn and
+    removed immediately, so artists never accumulate.
+    """
+    xmin, xmax, ymin, ymax = bounds
+    margin_x = (xmax - xmin) * 0.05
+    margin_y = (ymax - ymin) * 0.05
+    ax.set_xlim(xmin - margin_x, xmax + margin_x)
+    ax.set_ylim(ymin - margin_y, ymax + margin_y)
+    canvas.draw()
+    for chunk in chunks:
+        collection = LineCollection(chunk, colors=color)
+        ax.add_collection(collection, autolim=False)
+        ax.draw_artist(collection)
+        collection.remove()
+    extension = os.path.splitext(path)[1].lower()
+    imsave(path, np.asarray(canvas.buffer_rgba()),
+           format=RASTER_FORMAT_ALIASES.get(extension, extension[1:]))
+
+def _fill_subtree(task):
+    """
+    Worker: computes one subtree and writes it into the shared segment buffer.
+
+    Returns:
+        int: Offset right after the last written segment.
+    """
+    name, total, offset, p1, p2, angle, depth, branch_angle = task
+    shm = SharedMemory(name=name)
+    try:
+        buffer = np.ndarray((total, 2, 2), dtype=float, buffer=shm.buf)
+        for segments in pythagoras_levels(p1, p2, depth, angle, branch_angle):
+            buffer[offset:offset + len(segments)] = segments
+            offset += len(segments)
+        del buffer
+    finally:
+        shm.close()
+    return offset
+
+def pythagoras_segments_parallel(p1, p2, depth, angle = 0, branch_angle = 45,
+                                 split_depth = 4, workers = None):
+    """
+    Computes the Pythagoras tree with independent subtrees in worker processes.
+
+    The first split_depth levels are computed in the calling process. Each
+    of the 2 ** split_depth branches of the next level roots a subtree
+    whose segments a worker writes straight into a shared-memory NumPy
+    buffer at a precomputed offset, so no coordinates are pickled.
+
+    Args:
+        split_depth: Level at which the tree is split into subtrees.
+        workers: Number of worker processes (defaults to the CPU count).
+
+    Returns:
+        np.ndarray: Segments of all levels, shape (2 ** depth - 1, 2, 2),
+                    grouped by subtree rather than by level.
+    """
+    if depth <= split_depth:
+        return pythagoras_segments(p1, p2, depth, angle, branch_angle)
+
+    top = list(pythagoras_levels(p1, p2, split_depth + 1, angle, branch_angle))
+    roots = top.pop()
+    top_count = 2 ** split_depth - 1
+    subtree_depth = depth - split_depth
+    subtree_count = 2 ** subtree_depth - 1
+    total = top_count + len(roots) * subtree_count
+
+    shm = SharedMemory(create=True, size=total * 4 * np.dtype(float).itemsize)
+    try:
+        buffer = np.ndarray((total, 2, 2), dtype=float, buffer=shm.buf)
+        if top:
+            buffer[:top_count] = np.concatenate(top)
+        tasks = []
+        for i, (start, end) in enumerate(roots):
+            # A branch points along (sin(angle), cos(angle))
+            root_angle = math.degrees(math.atan2(end[0] - start[0], end[1] - start[1]))
+            tasks.append((shm.name, total, top_count + i * subtree_count,
+                          tuple(start), tuple(end), root_angle, subtree_depth, branch_angle))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(_fill_subtree, tasks):
+                pass
+        result = buffer.copy()
+        del buffer
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+def render_pythagoras_tree_parallel(path, size = 600, depth = 18, branch_angle = 45,
+                                    split_depth = 4, workers = None, color = 'blue',
+                                    min_pixels = None):
+    """
+    Renders the Pythagoras tree to a file, computing subtrees in parallel.
+
+    Segments from all workers are merged into one image: raster outputs
+    are streamed onto the Agg canvas chunk by chunk, vector outputs get a
+    single rasterized LineCollection. min_pixels caps the depth exactly as
+    in render_pythagoras_tree.
+    """
+    p1, p2 = _trunk(size)
+    depth = _lod_depth(p1, p2, size, depth, branch_angle, min_pixels)
+    segments = pythagoras_segments_parallel(p1, p2, depth, branch_angle = branch_angle,
+                                            split_depth = split_depth, workers = workers)
+    fig, canvas, ax = _new_canvas(size)
+    if os.path.splitext(path)[1].lower() not in RASTER_FORMATS:
+        collection = LineCollection(segments, colors=color)
+        collection.set_rasterized(True)
+        ax.add_collection(collection)
+        ax.autoscale_view()
+        fig.savefig(path)
+        return
+    bounds = _chunks_bounds([segments])
+    chunks = (segments[i:i + RASTER_CHUNK_SIZE]
+              for i in range(0, len(segments), RASTER_CHUNK_SIZE))
+    _stream_chunks(canvas, ax, path, chunks, bounds, color)
+
+def benchmark_parallel(depths = range(18, 23), max_workers = None, split_depth = 4):
+    """
+    Prints the time to compute the tree with 1..max_workers processes.
+
+    Speed-up is reported relative to the single-process
+    pythagoras_segments at the same depth.
+    """
+    max_workers = max_workers or os.cpu_count()
+    p1, p2 = _trunk(600)
+    print(f"{'depth':>5} {'workers':>8} {'seconds':>9} {'speed-up':>9}")
+    print("-" * 34)
+    for depth in depths:
+        started = time.perf_counter()
+        pythagoras_segments(p1, p2, depth)
+        serial = time.perf_counter() - started
+        print(f"{depth:>5} {'serial':>8} {serial:>9.3f} {1:>9.2f}")
+        for workers in range(1, max_workers + 1):
+            started = time.perf_counter()
+            pythagoras_segments_parallel(p1, p2, depth, split_depth = split_depth,
+                                         workers = workers)
+            elapsed = time.perf_counter() - started
+            print(f"{depth:>5} {workers:>8} {elapsed:>9.3f} {serial / elapsed:>9.2f}")
+
+def main(argv=None):
+    """
+    Main function to handle user input and draw the tree.
+
+    Without command-line arguments the depth is read interactively and the
+    tree is shown in a window; with --output the tree is rendered to a file.
+    """
+    parser = argparse.ArgumentParser(description="Draw a Pythagoras tree.")
+    parser.add_argument("--depth", type=int, help="number of tree levels")
+    parser.add_argument("--size", type=int, default=600, help="image size in pixels")
+    parser.add_argument("--angle", type=float, default=45, help="branch angle in degrees")
+    parser.add_argument("--output", help="write the image to this PNG/SVG path")
+    parser.add_argument("--min-pixels", type=float,
+                        help="skip branches shorter than this many pixels")
+    parser.add_argument("--workers", type=int,
+                        help="compute subtrees in this many processes (with --output)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="benchmark parallel scaling at depths 18-22 and exit")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark_parallel(max_workers = args.workers)
+        return
+    if args.output and args.workers:
+        render_pythagoras_tree_parallel(args.output, size = args.size, depth = args.depth or 5,
+                                        branch_angle = args.angle, workers = args.workers,
+                                        min_pixels = args.min_pixels)
+        return
+    if args.output:
+        render_pythagoras_tree(args.output, size = args.size, depth = args.depth or 5,
+                               branch_angle = args.angle, min_pixels = args.min_pixels)
+        return
+    if args.depth is not None:
+        draw_pythagoras_tree(size = args.size, depth = args.depth, branch_angle = args.angle,
+                             min_pixels = args.min_pixels)
+        return
     try:
         depth = int(input("Enter the depth of the tree: "))
         draw_pythagoras_tree(depth = depth if depth > 0 else 5)
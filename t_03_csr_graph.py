@@ -0,0 +1,269 @@
+"""
+Module for a compressed sparse row (CSR) graph and Dijkstra's algorithm over it.
+
+The dictionary-of-dictionaries graphs used by t_03_dijkstra_with_heap are
+converted into three flat NumPy arrays with integer vertex ids:
+
+    offsets[u]:offsets[u + 1]  - slice of the edges leaving vertex u
+    targets[i], weights[i]     - head and weight of edge i
+
+The kernel returns the same ShortestPathTree/DijkstraRow results as
+dijkstra_tree/dijkstra. If SciPy is installed, its compiled csgraph
+Dijkstra can be used on the same arrays.
+"""
+import heapq
+import time
+from array import array
+
+import numpy as np
+
+from t_03_dijkstra_with_heap import DijkstraRow, ShortestPathTree, dijkstra_tree
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra as scipy_dijkstra
+except ImportError:
+    csr_matrix = None
+    scipy_dijkstra = None
+
+
+class CSRGraph:
+    """
+    Represents a weighted directed graph in compressed sparse row form.
+    """
+    def __init__(self, vertices: list, offsets: np.ndarray, targets: np.ndarray,
+                 weights: np.ndarray):
+        self.vertices = vertices
+        self.index = {vertex: i for i, vertex in enumerate(vertices)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._lists = None
+
+    @property
+    def num_vertices(self) -> int:
+        """Number of vertices."""
+        return len(self.vertices)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of directed edges."""
+        return len(self.targets)
+
+    @classmethod
+    def from_dict(cls, graph: dict) -> 'CSRGraph':
+        """
+        Converts a dictionary-of-dictionaries graph.
+
+        Vertex ids follow the order of the dictionary, as in dijkstra_tree.
+        Vertices that appear only as neighbours are appended at the end.
+        """
+        vertices = list(graph)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = len(vertices)
+                    vertices.append(neighbor)
+
+        degrees = np.zeros(len(vertices), dtype=np.int64)
+        degrees[:len(graph)] = [len(neighbors) for neighbors in graph.values()]
+        offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+        targets = np.fromiter(
+            (index[v] for neighbors in graph.values() for v in neighbors),
+            dtype=np.int64, count=int(offsets[-1])
+        )
+        weights = np.fromiter(
+            (w for neighbors in graph.values() for w in neighbors.values()),
+            dtype=np.float64, count=int(offsets[-1])
+        )
+        return cls(vertices, offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, sources, targets, weights, directed: bool = True) -> 'CSRGraph':
+        """
+        Builds the graph from parallel sequences of edge tails, heads and weights.
+
+        Vertex labels may be of any sortable type; ids are assigned in
+        sorted label order. Undirected edges are stored in both directions.
+        """
+        sources = np.asarray(sources)
+        targets = np.asarray(targets)
+        weights = np.asarray(weights, dtype=np.float64)
+        labels, ids = np.unique(np.concatenate((sources, targets)), return_inverse=True)
+        tails, heads = ids[:len(sources)], ids[len(sources):]
+        if not directed:
+            tails, heads = np.concatenate((tails, heads)), np.concatenate((heads, tails))
+            weights = np.concatenate((weights, weights))
+
+        order = np.argsort(tails, kind='stable')
+        offsets = np.zeros(len(labels) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=len(labels)), out=offsets[1:])
+        return cls(labels.tolist(), offsets, heads[order].astype(np.int64), weights[order])
+
+    @classmethod
+    def from_edge_list(cls, path: str, directed: bool = False, comments: str = '#') -> 'CSRGraph':
+        """
+        Loads a whitespace-separated "source target weight" edge-list file.
+
+        Unlike from_edges, edges are undirected by default, since most
+        published edge lists (e.g. road networks) list each road once; pass
+        directed=True to keep them one-way. Lines starting with comments are
+        skipped; vertex labels are strings.
+        """
+        sources, targets, weights = [], [], []
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                fields = line.split()
+                if not fields or fields[0].startswith(comments):
+                    continue
+                sources.append(fields[0])
+                targets.append(fields[1])
+                weights.append(float(fields[2]))
+        return cls.from_edges(sources, targets, weights, directed)
+
+    def as_lists(self) -> tuple[list, list, list]:
+        """
+        Returns offsets, targets and weights as cached Python lists.
+
+        Element access on lists is much cheaper than on NumPy arrays in a
+        pure-Python loop, so the kernel works on these.
+        """
+        if self._lists is None:
+            self._lists = (self.offsets.tolist(), self.targets.tolist(), self.weights.tolist())
+        return self._lists
+
+
+def _dijkstra_kernel(offsets, targets, weights, source: int, count: int):
+    """
+    Dijkstra's algorithm over flat CSR sequences and integer vertex ids.
+
+    Uses only ints, floats and flat sequences so it can be compiled as is.
+
+    Returns:
+        tuple: distances, predecessor ids (-1 for none) and last edge weights.
+    """
+    infinity = float('infinity')
+    distances = [infinity] * count
+    predecessors = [-1] * count
+    last_weights = [infinity] * count
+    distances[source] = 0.0
+    last_weights[source] = 0.0
+    visited = bytearray(count)
+    priority_queue = [(0.0, source)]
+
+    while priority_queue:
+        current_cost, current = heapq.heappop(priority_queue)
+        if visited[current]:
+            continue
+        visited[current] = 1
+        for edge in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[edge]
+            distance = current_cost + weights[edge]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                predecessors[neighbor] = current
+                last_weights[neighbor] = weights[edge]
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    return distances, predecessors, last_weights
+
+
+def dijkstra_csr_tree(csr: CSRGraph, start, engine: str = "python") -> ShortestPathTree:
+    """
+    Runs Dijkstra's algorithm on a CSRGraph.
+
+    Args:
+        csr (CSRGraph): The graph.
+        start: The starting vertex label.
+        engine (str): "python" for the built-in kernel or "scipy" for
+                      scipy.sparse.csgraph.dijkstra (requires SciPy).
+
+    Returns:
+        ShortestPathTree: Distances and predecessors of every vertex.
+    """
+    source = csr.index[start]
+    if engine == "python":
+        distances, predecessors, weights = _dijkstra_kernel(
+            *csr.as_lists(), source, csr.num_vertices
+        )
+    elif engine == "scipy":
+        if scipy_dijkstra is None:
+            raise ImportError("engine 'scipy' requires SciPy to be installed")
+        matrix = csr_matrix((csr.weights, csr.targets, csr.offsets),
+                            shape=(csr.num_vertices, csr.num_vertices))
+        dist, pred = scipy_dijkstra(matrix, indices=source, return_predecessors=True)
+        pred = np.where(pred < 0, -1, pred)
+        # Along a shortest path the last edge weight is the distance difference;
+        # it is only computed where a predecessor exists to avoid inf - inf
+        last = np.full(csr.num_vertices, np.inf)
+        reached = pred >= 0
+        last[reached] = dist[reached] - dist[pred[reached]]
+        last[source] = 0.0
+        distances, predecessors, weights = dist.tolist(), pred.tolist(), last.tolist()
+    else:
+        raise ValueError(f"Unknown engine: {engine}")
+
+    return ShortestPathTree(start, csr.vertices, csr.index, distances,
+                            array('q', predecessors), weights)
+
+
+def dijkstra_csr(csr: CSRGraph, start, engine: str = "python") -> dict[str, DijkstraRow]:
+    """
+    Runs Dijkstra's algorithm on a CSRGraph and returns the DijkstraRow view.
+
+    The result has the same shape as t_03_dijkstra_with_heap.dijkstra,
+    with costs and weights as floats.
+    """
+    return dijkstra_csr_tree(csr, start, engine).rows()
+
+
+def random_graph(num_vertices: int, avg_degree: int = 4, seed: int = 42) -> dict:
+    """
+    Generates a random undirected dictionary-of-dictionaries graph with
+    integer vertices and integer weights from 1 to 100.
+    """
+    rng = np.random.default_rng(seed)
+    num_edges = num_vertices * avg_degree // 2
+    sources = rng.integers(num_vertices, size=num_edges).tolist()
+    targets = rng.integers(num_vertices, size=num_edges).tolist()
+    weights = rng.integers(1, 101, size=num_edges).tolist()
+    graph = {vertex: {} for vertex in range(num_vertices)}
+    for u, v, w in zip(sources, targets, weights):
+        if u != v:
+            graph[u][v] = w
+            graph[v][u] = w
+    return graph
+
+
+def benchmark(sizes=(10 ** 4, 10 ** 5, 10 ** 6), avg_degree: int = 4):
+    """
+    Compares dict-based dijkstra_tree with the CSR kernels on random graphs.
+    """
+    engines = ["python"] + (["scipy"] if scipy_dijkstra is not None else [])
+    header = f"{'vertices':>9} {'edges':>9} {'dict':>8} {'to CSR':>8}"
+    header += "".join(f" {'csr-' + engine:>12}" for engine in engines)
+    print(header)
+    print("-" * len(header))
+    for size in sizes:
+        graph = random_graph(size, avg_degree)
+
+        started = time.perf_counter()
+        dijkstra_tree(graph, 0)
+        dict_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        csr = CSRGraph.from_dict(graph)
+        convert_time = time.perf_counter() - started
+
+        line = f"{size:>9} {csr.num_edges:>9} {dict_time:>8.3f} {convert_time:>8.3f}"
+        for engine in engines:
+            started = time.perf_counter()
+            dijkstra_csr_tree(csr, 0, engine)
+            line += f" {time.perf_counter() - started:>12.3f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    benchmark()
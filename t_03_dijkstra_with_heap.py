@@ -3,19 +3,396 @@ Module for Dijkstra's algorithm implementation.
 
 This module contains an implementation of Dijkstra's algorithm for finding
 the shortest paths in a weighted graph using a binary heap (priority queue).
+
+Importing it only loads the standard library; the NetworkX/Matplotlib
+visualization lives in t_03_draw_graph and is imported lazily by main().
 """
+import argparse
+from array import array
 from collections import namedtuple
 import heapq
-
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
+import subprocess
+import sys
+import time
 
 DijkstraRow = namedtuple('DijkstraRow', ['vertex', 'known', 'cost', 'weight', 'path', "full_path"] )
 
+
+class LazyHeapQueue:
+    """
+    Binary heap (heapq) with lazy deletion.
+
+    Improving a priority pushes a duplicate entry; outdated entries are
+    popped later and must be skipped by the caller.
+    """
+    def __init__(self):
+        self.heap = []
+        self.pushes = 0
+        self.pops = 0
+        self.decrease_keys = 0
+        self.peak_size = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def update(self, item, priority):
+        """Inserts item or lowers its priority (as a duplicate entry)."""
+        heapq.heappush(self.heap, (priority, item))
+        self.pushes += 1
+        if len(self.heap) > self.peak_size:
+            self.peak_size = len(self.heap)
+
+    def pop(self) -> tuple:
+        """Removes and returns the (priority, item) pair with the lowest priority."""
+        self.pops += 1
+        return heapq.heappop(self.heap)
+
+    def stats(self) -> dict:
+        """Returns push/pop/decrease-key counters and the peak queue size."""
+        return {'pushes': self.pushes, 'pops': self.pops,
+                'decrease_keys': self.decrease_keys, 'peak_size': self.peak_size}
+
+
+class IndexedHeapQueue(LazyHeapQueue):
+    """
+    Indexed binary heap over integer items 0..capacity-1 with a true decrease_key.
+
+    Every item is stored at most once, so the heap never grows beyond the
+    number of vertices and no stale entries are popped.
+    """
+    def __init__(self, capacity: int):
+        super().__init__()
+        self.positions = [-1] * capacity
+        self.priorities = [0] * capacity
+
+    def update(self, item, priority):
+        """Inserts item or lowers its priority in place."""
+        position = self.positions[item]
+        self.priorities[item] = priority
+        if position < 0:
+            self.heap.append(item)
+            self.positions[item] = len(self.heap) - 1
+            self.pushes += 1
+            if len(self.heap) > self.peak_size:
+                self.peak_size = len(self.heap)
+            self._sift_up(len(self.heap) - 1)
+        else:
+            self.decrease_keys += 1
+            self._sift_up(position)
+
+    def decrease_key(self, item, priority):
+        """Lowers the priority of an item that is already in the heap."""
+        self.update(item, priority)
+
+    def pop(self) -> tuple:
+        """Removes and returns the (priority, item) pair with the lowest priority."""
+        self.pops += 1
+        heap = self.heap
+        item = heap[0]
+        last = heap.pop()
+        self.positions[item] = -1
+        if heap:
+            heap[0] = last
+            self.positions[last] = 0
+            self._sift_down(0)
+        return self.priorities[item], item
+
+    def _sift_up(self, position: int):
+        """Moves the item at position up until its parent is not larger."""
+        heap, positions, priorities = self.heap, self.positions, self.priorities
+        item = heap[position]
+        priority = priorities[item]
+        while position > 0:
+            parent_position = (position - 1) >> 1
+            parent = heap[parent_position]
+            if priorities[parent] <= priority:
+                break
+            heap[position] = parent
+            positions[parent] = position
+            position = parent_position
+        heap[position] = item
+        positions[item] = position
+
+    def _sift_down(self, position: int):
+        """Moves the item at position down until no child is smaller."""
+        heap, positions, priorities = self.heap, self.positions, self.priorities
+        size = len(heap)
+        item = heap[position]
+        priority = priorities[item]
+        while True:
+            child_position = 2 * position + 1
+            if child_position >= size:
+                break
+            right_position = child_position + 1
+            if right_position < size \
+                    and priorities[heap[right_position]] < priorities[heap[child_position]]:
+                child_position = right_position
+            child = heap[child_position]
+            if priorities[child] >= priority:
+                break
+            heap[position] = child
+            positions[child] = position
+            position = child_position
+        heap[position] = item
+        positions[item] = position
+
+
+class BucketQueue(LazyHeapQueue):
+    """
+    Radix/bucket queue for Dial's algorithm with integer weights up to max_weight.
+
+    While Dijkstra's algorithm runs, all queued priorities lie within
+    max_weight of the last popped one, so max_weight + 1 circular buckets
+    suffice. Decrease-key moves an item between buckets in O(1).
+    """
+    def __init__(self, max_weight: int):
+        super().__init__()
+        self.buckets = [{} for _ in range(max_weight + 1)]
+        self.where = {}
+        self.current = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def update(self, item, priority):
+        """Inserts item or moves it to the bucket of its lower priority."""
+        buckets = self.buckets
+        old_priority = self.where.get(item)
+        if old_priority is None:
+            self.pushes += 1
+            self.size += 1
+            if self.size > self.peak_size:
+                self.peak_size = self.size
+        else:
+            self.decrease_keys += 1
+            del buckets[old_priority % len(buckets)][item]
+        buckets[priority % len(buckets)][item] = None
+        self.where[item] = priority
+
+    def pop(self) -> tuple:
+        """Removes and returns the (priority, item) pair with the lowest priority."""
+        self.pops += 1
+        buckets = self.buckets
+        while not buckets[self.current % len(buckets)]:
+            self.current += 1
+        bucket = buckets[self.current % len(buckets)]
+        item = next(iter(bucket))
+        del bucket[item]
+        del self.where[item]
+        self.size -= 1
+        return self.current, item
+
+
+def make_queue(kind: str, graph) -> LazyHeapQueue:
+    """
+    Creates a priority queue for dijkstra_tree.
+
+    Args:
+        kind (str): "heap" (heapq with lazy deletion), "indexed" (indexed
+                    binary heap with decrease-key) or "bucket" (Dial's
+                    bucket queue; weights must be non-negative integers).
+        graph (dict): The graph the queue will be used for.
+    """
+    if kind == "heap":
+        return LazyHeapQueue()
+    if kind == "indexed":
+        return IndexedHeapQueue(len(graph))
+    if kind == "bucket":
+        max_weight = 0
+        for neighbors in graph.values():
+            for weight in neighbors.values():
+                if not isinstance(weight, int) or weight < 0:
+                    raise ValueError("queue 'bucket' needs non-negative integer weights")
+                max_weight = max(max_weight, weight)
+        return BucketQueue(max_weight)
+    raise ValueError(f"Unknown priority queue: {kind}")
+
+
+class ShortestPathTree:
+    """
+    Compact result of Dijkstra's algorithm: distances and predecessors only.
+
+    Vertices are numbered in the order of the graph dictionary, and the
+    distance, predecessor id and last edge weight of every vertex are kept
+    in flat sequences indexed by that number (predecessors in an
+    array('q')). Full paths are rebuilt only for the vertices a caller
+    asks about. queue_stats holds the priority queue counters, if any.
+    sources is the set of start vertices; it defaults to {start} and holds
+    every facility of a multi-source search.
+    """
+    def __init__(self, start, vertices: list, index: dict, distances: list,
+                 predecessors: array, weights: list, queue_stats: dict = None,
+                 sources=None):
+        self.start = start
+        self.sources = frozenset(sources) if sources is not None else frozenset((start,))
+        self.vertices = vertices
+        self.index = index
+        self.distances = distances
+        self.predecessors = predecessors
+        self.weights = weights
+        self.queue_stats = queue_stats
+
+    def distance(self, vertex) -> float:
+        """Returns the shortest distance from the start to vertex."""
+        return self.distances[self.index[vertex]]
+
+    def predecessor(self, vertex):
+        """Returns the vertex preceding vertex on its shortest path, or None."""
+        pred = self.predecessors[self.index[vertex]]
+        return self.vertices[pred] if pred >= 0 else None
+
+    def path(self, vertex) -> list:
+        """
+        Rebuilds the shortest path from the start to vertex.
+
+        An unreachable vertex yields [vertex], as in DijkstraRow.full_path.
+        """
+        idx = self.index[vertex]
+        reversed_path = [vertex]
+        pred = self.predecessors[idx]
+        while pred >= 0:
+            reversed_path.append(self.vertices[pred])
+            pred = self.predecessors[pred]
+        reversed_path.reverse()
+        return reversed_path
+
+    def row(self, vertex) -> DijkstraRow:
+        """Returns the DijkstraRow view of a single vertex."""
+        idx = self.index[vertex]
+        if vertex in self.sources:
+            return DijkstraRow(vertex, True, 0, 0, vertex, [vertex])
+        cost = self.distances[idx]
+        if cost == float('infinity'):
+            return DijkstraRow(vertex, False, cost, cost, "", [vertex])
+        return DijkstraRow(vertex, True, cost, self.weights[idx],
+                           self.predecessor(vertex), self.path(vertex))
+
+    def rows(self) -> dict[str, DijkstraRow]:
+        """Returns the full DijkstraRow view, as produced by dijkstra()."""
+        return {vertex: self.row(vertex) for vertex in self.vertices}
+
+
+def dijkstra_tree(graph, start, queue: str = "heap") -> ShortestPathTree:
+    """
+    Runs Dijkstra's algorithm storing only distances and predecessors.
+
+    No path lists are built or copied during relaxation, so memory stays
+    O(V) and paths can be reconstructed later with ShortestPathTree.path.
+    The push/pop counters and peak size of the priority queue are returned
+    in ShortestPathTree.queue_stats.
+
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        start (str): The starting vertex key.
+        queue (str): Priority queue to use, see make_queue.
+
+    Returns:
+        ShortestPathTree: Distances and predecessors of every vertex.
+    """
+    vertices = list(graph)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    distances, predecessors, weights, _, stats = run_dijkstra(
+        graph, vertices, index, [index[start]], queue
+    )
+    return ShortestPathTree(start, vertices, index, distances, predecessors, weights, stats)
+
+
+def run_dijkstra(graph, vertices: list, index: dict, sources: list, queue: str = "heap"):
+    """
+    Core of Dijkstra's algorithm over integer vertex ids.
+
+    Every source id starts at distance 0, so several sources give a
+    multi-source search in which each vertex is reached from its nearest
+    source.
+
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        vertices (list): Vertex keys by id.
+        index (dict): Vertex key -> id.
+        sources (list): Ids of the start vertices.
+        queue (str): Priority queue to use, see make_queue.
+
+    Returns:
+        tuple: distances, predecessors, last edge weights, origins (position
+               in sources of the nearest source, -1 if unreachable) and the
+               queue stats.
+    """
+    count = len(vertices)
+    # Costs stay in lists so integer weights keep their type in the results
+    distances = [float('infinity')] * count
+    predecessors = array('q', [-1]) * count
+    weights = [float('infinity')] * count
+    origins = array('q', [-1]) * count
+
+    visited = bytearray(count)
+    priority_queue = make_queue(queue, graph)
+    update, pop = priority_queue.update, priority_queue.pop
+    for position, source in enumerate(sources):
+        distances[source] = 0
+        weights[source] = 0
+        origins[source] = position
+        update(source, 0)
+
+    while priority_queue:
+        current_cost, current = pop()
+        if visited[current]:
+            continue
+        visited[current] = 1
+        origin = origins[current]
+
+        for neighbor, weight in graph[vertices[current]].items():
+            distance = current_cost + weight
+            neighbor_idx = index[neighbor]
+            if distance < distances[neighbor_idx]:
+                distances[neighbor_idx] = distance
+                predecessors[neighbor_idx] = current
+                weights[neighbor_idx] = weight
+                origins[neighbor_idx] = origin
+                update(neighbor_idx, distance)
+
+    return distances, predecessors, weights, origins, priority_queue.stats()
+
+
+def nearest_facility(graph, facilities: list, queue: str = "heap") -> tuple:
+    """
+    Finds the nearest facility of every vertex with one multi-source search.
+
+    All facilities are put into the priority queue at distance 0 at once,
+    which is much cheaper than running dijkstra from each of them.
+
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        facilities (list): Facility vertex keys.
+        queue (str): Priority queue to use, see make_queue.
+
+    Returns:
+        tuple: (ShortestPathTree, nearest) where the tree holds the distance
+               and path to the nearest facility (paths start at that
+               facility) and nearest maps each reachable vertex to it.
+    """
+    vertices = list(graph)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    distances, predecessors, weights, origins, stats = run_dijkstra(
+        graph, vertices, index, [index[facility] for facility in facilities], queue
+    )
+    nearest = {
+        vertex: facilities[origin]
+        for vertex, origin in zip(vertices, origins) if origin >= 0
+    }
+    tree = ShortestPathTree(tuple(facilities), vertices, index, distances,
+                            predecessors, weights, stats, sources=facilities)
+    return tree, nearest
+
+
 def dijkstra(graph, start) -> dict[str, DijkstraRow]:
     """
     Implements Dijkstra's algorithm to find the shortest paths from a start node.
 
+    This is the DijkstraRow view over dijkstra_tree; use dijkstra_tree
+    directly when full paths are not needed for every vertex.
+
     Args:
         graph (dict): The graph represented as a dictionary of dictionaries.
         start (str): The starting vertex key.
@@ -24,42 +401,177 @@ def dijkstra(graph, start) -> dict[str, DijkstraRow]:
         dict[str, DijkstraRow]: A dictionary where keys are vertex names and values
                                 are DijkstraRow named tuples containing path info.
     """
-    # Ініціалізація відстаней та множини невідвіданих вершин
-    distances = {
-        vertex: DijkstraRow(
-            vertex,False, float('infinity'), float('infinity'), "", [vertex]
-        ) for vertex in graph
-    }
-    distances[start] = DijkstraRow(start, True, 0, 0, start, [start])
-    visited = set()
-    priority_queue = [(0, start)]
+    return dijkstra_tree(graph, start).rows()
 
-    while priority_queue:
-        # Знаходження вершини з найменшою відстанню серед невідвіданих
-        _, current_vertex = heapq.heappop(priority_queue)
 
-        if current_vertex in visited:
+def _target_row(graph, source, target, cost, predecessors: dict) -> DijkstraRow:
+    """
+    Builds the DijkstraRow of target from a predecessor map.
+    """
+    if target == source:
+        return DijkstraRow(target, True, 0, 0, target, [target])
+    if cost == float('infinity'):
+        return DijkstraRow(target, False, cost, cost, "", [target])
+    full_path = [target]
+    while full_path[-1] != source:
+        full_path.append(predecessors[full_path[-1]])
+    full_path.reverse()
+    prev = full_path[-2]
+    return DijkstraRow(target, True, cost, graph[prev][target], prev, full_path)
+
+
+def reverse_graph(graph) -> dict:
+    """
+    Returns the graph with every edge reversed.
+
+    Bidirectional search walks the backward half over this graph; for
+    undirected (symmetric) graphs it equals the graph itself.
+    """
+    reversed_graph = {vertex: {} for vertex in graph}
+    for u, neighbors in graph.items():
+        for v, weight in neighbors.items():
+            reversed_graph.setdefault(v, {})[u] = weight
+    return reversed_graph
+
+
+def astar(graph, source, target, heuristic=None) -> DijkstraRow:
+    """
+    Finds the shortest path from source to target with A* search.
+
+    Without a heuristic this is Dijkstra's algorithm that stops as soon as
+    the target is settled. Only vertices that are actually reached are
+    stored, so a query never pays for the whole graph.
+
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        source: The starting vertex key.
+        target: The destination vertex key.
+        heuristic: Callable heuristic(vertex, target) returning a lower bound
+                   of the remaining distance (admissible estimate).
+
+    Returns:
+        DijkstraRow: The row of target, as in dijkstra(graph, source)[target].
+    """
+    distances = {source: 0}
+    predecessors = {}
+    priority_queue = [(heuristic(source, target) if heuristic else 0, 0, source)]
+
+    while priority_queue:
+        _, current_cost, current = heapq.heappop(priority_queue)
+        # Skip stale entries left behind by later improvements
+        if current_cost > distances[current]:
             continue
+        if current == target:
+            break
+
+        for neighbor, weight in graph[current].items():
+            distance = current_cost + weight
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current
+                priority = distance + heuristic(neighbor, target) if heuristic else distance
+                heapq.heappush(priority_queue, (priority, distance, neighbor))
+
+    cost = distances.get(target, float('infinity'))
+    return _target_row(graph, source, target, cost, predecessors)
+
+
+def bidirectional_dijkstra(graph, source, target, backward_graph) -> DijkstraRow:
+    """
+    Finds the shortest path from source to target searching from both ends.
+
+    Forward and backward Dijkstra searches are advanced alternately and
+    stop once the sum of their frontier distances cannot improve the best
+    meeting point found so far.
 
-        visited.add(current_vertex)
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        source: The starting vertex key.
+        target: The destination vertex key.
+        backward_graph (dict): reverse_graph(graph), built once by the caller
+                               and reused across queries, or graph itself
+                               when the graph is undirected.
+
+    Returns:
+        DijkstraRow: The row of target, as in dijkstra(graph, source)[target].
+    """
+    if source == target:
+        return _target_row(graph, source, target, 0, {})
 
-        # Якщо поточна відстань є нескінченністю, то ми завершили роботу
-        if distances[current_vertex].cost == float('infinity'):
+    graphs = (graph, backward_graph)
+    distances = ({source: 0}, {target: 0})
+    predecessors = ({}, {})
+    queues = ([(0, source)], [(0, target)])
+    visited = (set(), set())
+    best_cost = float('infinity')
+    meeting = None
+    side = 0
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best_cost:
             break
+        current_cost, current = heapq.heappop(queues[side])
+        if current not in visited[side]:
+            visited[side].add(current)
+            own, other = distances[side], distances[1 - side]
+            for neighbor, weight in graphs[side][current].items():
+                distance = current_cost + weight
+                if distance < own.get(neighbor, float('infinity')):
+                    own[neighbor] = distance
+                    predecessors[side][neighbor] = current
+                    heapq.heappush(queues[side], (distance, neighbor))
+                if neighbor in other and distance + other[neighbor] < best_cost:
+                    best_cost = distance + other[neighbor]
+                    meeting = (current, neighbor) if side == 0 else (neighbor, current)
+        side = 1 - side
 
-        for neighbor, weight in graph[current_vertex].items():
-            distance = distances[current_vertex].cost + weight
+    if meeting is None:
+        return _target_row(graph, source, target, float('infinity'), {})
 
-            # Якщо нова відстань коротша, то оновлюємо найкоротший шлях
-            if distance < distances[neighbor].cost:
-                full_path = distances[current_vertex].full_path[:-1] + [current_vertex] + [neighbor]
-                distances[neighbor] = DijkstraRow(
-                        neighbor, True, distance, weight, current_vertex, full_path)
+    # Join the forward half up to meeting[0] with the backward half from meeting[1]
+    forward, backward = predecessors
+    path_predecessors = {}
+    vertex = meeting[0]
+    while vertex != source:
+        path_predecessors[vertex] = forward[vertex]
+        vertex = forward[vertex]
+    path_predecessors[meeting[1]] = meeting[0]
+    vertex = meeting[1]
+    while vertex != target:
+        path_predecessors[backward[vertex]] = vertex
+        vertex = backward[vertex]
+    return _target_row(graph, source, target, best_cost, path_predecessors)
 
-                heapq.heappush(priority_queue, (distance, neighbor))
 
+def shortest_path(graph, source, target, method: str = "dijkstra",
+                  heuristic=None, backward_graph=None) -> DijkstraRow:
+    """
+    Answers a single point-to-point shortest path query.
 
-    return distances
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        source: The starting vertex key.
+        target: The destination vertex key.
+        method (str): "dijkstra" (early exit), "bidirectional" or "astar".
+        heuristic: Admissible heuristic(vertex, target), required for "astar".
+        backward_graph (dict): Reversed graph (or graph itself if undirected),
+                               required for "bidirectional".
+
+    Returns:
+        DijkstraRow: The row of target, as in dijkstra(graph, source)[target].
+    """
+    if method == "dijkstra":
+        return astar(graph, source, target)
+    if method == "bidirectional":
+        if backward_graph is None:
+            raise ValueError("method 'bidirectional' requires backward_graph, "
+                             "e.g. reverse_graph(graph) built once")
+        return bidirectional_dijkstra(graph, source, target, backward_graph)
+    if method == "astar":
+        if heuristic is None:
+            raise ValueError("method 'astar' requires a heuristic")
+        return astar(graph, source, target, heuristic)
+    raise ValueError(f"Unknown shortest path method: {method}")
 
 
 graph_ = {
@@ -72,30 +584,99 @@ graph_ = {
     'G': {'A': 10, 'B': 2}
 }
 
-# Виконання алгоритму Дейкстри
 START_VERTEX = 'A'
-dijkstra_results = dijkstra(graph_, START_VERTEX)
-
-# Вивід результатів
-print(f"{'vertex':<7} {'known':<7} {'cost':<7} {'weight':<7} {'path':<7} {'full_path':<20}")
-print("-" * 50)
-for node in sorted(dijkstra_results.keys()):
-    row = dijkstra_results[node]
-    print(f"{row.vertex:<7} {str(row.known):<7} {row.cost:<7} {row.weight:<7} "
-          f"{str(row.path):<7} {str(row.full_path):<20}")
-
-
-# Створення графа для візуалізації
-G = nx.Graph()
-for u, neighbors in graph_.items():
-    for v, weight_ in neighbors.items():
-        G.add_edge(u, v, weight=weight_)
-
-# Візуалізація графа
-pos = nx.spring_layout(G, seed=42)
-plt.figure(figsize=(8, 6))
-nx.draw(G, pos, with_labels=True, node_size=700, node_color="skyblue", font_size=15, width=2)
-labels = nx.get_edge_attributes(G, 'weight')
-nx.draw_networkx_edge_labels(G, pos, edge_labels=labels)
-
-plt.show()
+
+# Modules that must not be loaded by a plain import of this module
+HEAVY_MODULES = ('networkx', 'matplotlib', 'numpy')
+
+
+def print_results(dijkstra_results: dict[str, DijkstraRow]):
+    """
+    Prints the DijkstraRow results as a table sorted by vertex.
+    """
+    print(f"{'vertex':<7} {'known':<7} {'cost':<7} {'weight':<7} {'path':<7} {'full_path':<20}")
+    print("-" * 50)
+    for node in sorted(dijkstra_results.keys()):
+        row = dijkstra_results[node]
+        print(f"{row.vertex:<7} {str(row.known):<7} {row.cost:<7} {row.weight:<7} "
+              f"{str(row.path):<7} {str(row.full_path):<20}")
+
+
+def benchmark_queues(graph, start, kinds=("heap", "indexed", "bucket")):
+    """
+    Runs dijkstra_tree with each priority queue and prints time and queue stats.
+    """
+    print(f"{'queue':<8} {'seconds':>8} {'pushes':>9} {'pops':>9} "
+          f"{'decrease':>9} {'peak':>9}")
+    print("-" * 57)
+    for kind in kinds:
+        started = time.perf_counter()
+        stats = dijkstra_tree(graph, start, kind).queue_stats
+        elapsed = time.perf_counter() - started
+        print(f"{kind:<8} {elapsed:>8.3f} {stats['pushes']:>9} {stats['pops']:>9} "
+              f"{stats['decrease_keys']:>9} {stats['peak_size']:>9}")
+
+
+def benchmark_import(max_seconds: float = 0.5, repeat: int = 5) -> float:
+    """
+    Measures the cold import time of this module in fresh interpreters.
+
+    Acts as a regression check: raises RuntimeError if the best import time
+    exceeds max_seconds or if any of HEAVY_MODULES gets imported.
+
+    Returns:
+        float: The best of repeat import times, in seconds.
+    """
+    module_dir, module_file = os.path.split(os.path.abspath(__file__))
+    probe = (
+        "import sys, time; started = time.perf_counter(); "
+        f"import {os.path.splitext(module_file)[0]}; "
+        "print(time.perf_counter() - started); "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    best = float('infinity')
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", probe], capture_output=True,
+                                text=True, check=True, cwd=module_dir).stdout.splitlines()
+        best = min(best, float(output[0]))
+        loaded = output[1] if len(output) > 1 else ""
+        if loaded:
+            raise RuntimeError(f"Import pulls in heavy modules: {loaded}")
+    if best > max_seconds:
+        raise RuntimeError(f"Import took {best:.3f} s, limit is {max_seconds:.3f} s")
+    return best
+
+
+def main(argv=None):
+    """
+    Runs Dijkstra's algorithm on the sample graph, prints and draws the result.
+    """
+    parser = argparse.ArgumentParser(description="Dijkstra's algorithm on a sample graph.")
+    parser.add_argument("--start", default=START_VERTEX, help="start vertex")
+    parser.add_argument("--no-plot", action="store_true", help="skip the visualization")
+    parser.add_argument("--check-import", action="store_true",
+                        help="benchmark the import time of this module and exit")
+    parser.add_argument("--compare-queues", action="store_true",
+                        help="compare the priority queues on the sample graph and exit")
+    args = parser.parse_args(argv)
+
+    if args.check_import:
+        print(f"import time: {benchmark_import():.4f} s")
+        return
+    if args.compare_queues:
+        benchmark_queues(graph_, args.start)
+        return
+
+    # Виконання алгоритму Дейкстри
+    dijkstra_results = dijkstra(graph_, args.start)
+
+    # Вивід результатів
+    print_results(dijkstra_results)
+
+    if not args.no_plot:
+        from t_03_draw_graph import draw_graph  # pylint: disable=import-outside-toplevel
+        draw_graph(graph_, dijkstra_tree(graph_, args.start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Module for visualizing weighted graphs with NetworkX and Matplotlib.
+
+Kept separate from t_03_dijkstra_with_heap so that the algorithm can be
+imported without loading the plotting stack. Small graphs are drawn with
+NetworkX's spring layout and full labels; large graphs go through
+draw_large_graph, which never builds a NetworkX graph.
+"""
+import networkx as nx
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from t_03_csr_graph import CSRGraph
+
+# Graphs with more vertices than this are drawn by draw_large_graph
+LARGE_GRAPH_THRESHOLD = 300
+
+
+def draw_graph(graph, tree=None):
+    """
+    Draws a graph given as a dictionary of dictionaries with edge weights.
+
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        tree (ShortestPathTree): Optional result of dijkstra_tree to
+                                 highlight on large graphs.
+    """
+    if len(graph) > LARGE_GRAPH_THRESHOLD:
+        draw_large_graph(graph, tree)
+        return
+
+    # Створення графа для візуалізації
+    nx_graph = nx.Graph()
+    for u, neighbors in graph.items():
+        for v, weight in neighbors.items():
+            nx_graph.add_edge(u, v, weight=weight)
+
+    # Візуалізація графа
+    pos = nx.spring_layout(nx_graph, seed=42)
+    plt.figure(figsize=(8, 6))
+    nx.draw(nx_graph, pos, with_labels=True, node_size=700, node_color="skyblue",
+            font_size=15, width=2)
+    labels = nx.get_edge_attributes(nx_graph, 'weight')
+    nx.draw_networkx_edge_labels(nx_graph, pos, edge_labels=labels)
+
+    plt.show()
+
+
+def _bfs_levels(offsets: np.ndarray, targets: np.ndarray, source: int) -> np.ndarray:
+    """
+    Returns the hop distance from source to every vertex, -1 if unreachable.
+
+    The whole frontier of a level is expanded with one vectorised gather,
+    so the Python loop runs once per level, not once per vertex.
+    """
+    levels = np.full(len(offsets) - 1, -1)
+    levels[source] = 0
+    frontier = np.array([source])
+    level = 0
+    while frontier.size:
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        edges = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        neighbors = targets[edges]
+        frontier = np.unique(neighbors[levels[neighbors] < 0])
+        level += 1
+        levels[frontier] = level
+    return levels
+
+
+def pivot_mds_layout(csr: CSRGraph, pivots: int = 50, seed: int = 42) -> np.ndarray:
+    """
+    Computes a pivot MDS layout (Brandes and Pich) from BFS hop distances.
+
+    Hop distances from a few pivots, picked farthest-first starting at the
+    highest-degree vertex, are double-centred, and the two leading singular
+    vectors of that V x pivots matrix give the coordinates. This
+    approximates classical MDS of the full distance matrix, so long paths
+    and grids come out unfolded, at the cost of one O(E) BFS per pivot.
+    Edge directions and weights are ignored. Vertices not connected to
+    the first pivot are scattered at random over the same area.
+
+    Args:
+        csr (CSRGraph): The graph to lay out.
+        pivots (int): Number of BFS sources.
+        seed (int): Seed for placing the disconnected vertices.
+
+    Returns:
+        np.ndarray: Vertex positions, shape (V, 2).
+    """
+    count = csr.num_vertices
+    # BFS follows edges both ways so directed graphs get a layout too
+    sources = np.repeat(np.arange(count), np.diff(csr.offsets))
+    both_sources = np.concatenate((sources, csr.targets))
+    order = np.argsort(both_sources, kind='stable')
+    targets = np.concatenate((csr.targets, sources))[order]
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(both_sources, minlength=count))))
+
+    pivot = int(np.argmax(np.diff(offsets)))
+    levels = _bfs_levels(offsets, targets, pivot)
+    reached = np.flatnonzero(levels >= 0)
+    distances = [levels[reached]]
+    nearest = distances[0].copy()
+    for _ in range(min(pivots, len(reached)) - 1):
+        pivot = int(reached[np.argmax(nearest)])
+        distances.append(_bfs_levels(offsets, targets, pivot)[reached])
+        np.minimum(nearest, distances[-1], out=nearest)
+
+    squared = np.column_stack(distances).astype(float) ** 2
+    squared -= squared.mean(axis=0)
+    squared -= squared.mean(axis=1)[:, None]
+    vectors, values, _ = np.linalg.svd(squared, full_matrices=False)
+    coordinates = vectors[:, :2] * values[:2]
+
+    rng = np.random.default_rng(seed)
+    positions = np.zeros((count, 2))
+    positions[reached, :coordinates.shape[1]] = coordinates
+    low, high = positions[reached].min(axis=0), positions[reached].max(axis=0)
+    unreached = np.flatnonzero(levels < 0)
+    positions[unreached] = rng.uniform(low, high, size=(len(unreached), 2))
+    return positions
+
+
+def draw_large_graph(graph, tree=None, path=None, max_labels: int = 50,
+                     positions: np.ndarray = None, seed: int = 42):
+    """
+    Draws a large graph with one scatter and one LineCollection per edge layer.
+
+    Vertex labels are drawn for a random sample of at most max_labels
+    vertices and edge weight labels are skipped. If a ShortestPathTree is
+    given, only its tree edges are highlighted on top of the graph.
+
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        tree (ShortestPathTree): Optional result of dijkstra_tree.
+        path (str): Save the image to this file instead of showing it.
+        max_labels (int): Maximum number of vertex labels.
+        positions (np.ndarray): Precomputed (V, 2) positions in the order
+                                of the graph dictionary.
+        seed (int): Seed for the layout and label sampling.
+    """
+    csr = CSRGraph.from_dict(graph)
+    if positions is None:
+        positions = pivot_mds_layout(csr, seed=seed)
+
+    if path:
+        fig = Figure(figsize=(10, 10))
+        FigureCanvasAgg(fig)
+    else:
+        fig = plt.figure(figsize=(10, 10))
+    ax = fig.add_subplot()
+    ax.axis('off')
+
+    sources = np.repeat(np.arange(csr.num_vertices), np.diff(csr.offsets))
+    # An edge stored in both directions is drawn once, from the lower id;
+    # one-way edges of directed graphs are always drawn
+    keys = sources * csr.num_vertices + csr.targets
+    reverse_keys = csr.targets * csr.num_vertices + sources
+    once = ~((sources > csr.targets) & np.isin(reverse_keys, keys))
+    edges = np.stack((positions[sources[once]], positions[csr.targets[once]]), axis=1)
+    ax.add_collection(LineCollection(edges, colors="lightgray", linewidths=0.3, zorder=1))
+    ax.scatter(positions[:, 0], positions[:, 1], s=2, c="skyblue", zorder=2)
+
+    if tree is not None:
+        predecessors = np.frombuffer(tree.predecessors, dtype=np.int64)
+        reached = np.flatnonzero(predecessors >= 0)
+        tree_edges = np.stack((positions[predecessors[reached]], positions[reached]), axis=1)
+        ax.add_collection(LineCollection(tree_edges, colors="red", linewidths=0.8, zorder=3))
+        # Roots are the reached vertices without a predecessor: the start
+        # vertex, or every facility of a nearest_facility tree
+        distances = np.array(tree.distances, dtype=float)
+        roots = np.flatnonzero((predecessors < 0) & np.isfinite(distances))
+        ax.scatter(positions[roots, 0], positions[roots, 1], s=40, c="red", zorder=4)
+
+    rng = np.random.default_rng(seed)
+    labelled = rng.choice(csr.num_vertices, size=min(max_labels, csr.num_vertices),
+                          replace=False)
+    for vertex in labelled:
+        ax.annotate(str(csr.vertices[vertex]), positions[vertex], fontsize=6, zorder=5)
+
+    ax.autoscale_view()
+    if path:
+        fig.savefig(path)
+    else:
+        plt.show()
@@ -0,0 +1,107 @@
+"""
+Module for running Dijkstra's algorithm from many sources in parallel.
+
+The graph is handed to the worker processes once: on platforms with the
+"fork" start method the workers inherit it from the parent, elsewhere it
+is pickled once per worker through the pool initializer. Individual tasks
+carry only a source vertex, and results are streamed back as they finish.
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from t_03_dijkstra_with_heap import ShortestPathTree, dijkstra_tree, run_dijkstra
+
+# Graph, vertex list and index of the current worker process
+_WORKER_STATE = {}
+
+
+def _init_worker(graph=None):
+    """
+    Prepares a worker: takes the graph (inherited or passed once) and numbers its vertices.
+    """
+    if graph is not None:
+        _WORKER_STATE['graph'] = graph
+    graph = _WORKER_STATE['graph']
+    vertices = list(graph)
+    _WORKER_STATE['vertices'] = vertices
+    _WORKER_STATE['index'] = {vertex: i for i, vertex in enumerate(vertices)}
+
+
+def _solve_source(source, queue):
+    """
+    Worker: runs Dijkstra from one source and returns the flat result arrays.
+    """
+    state = _WORKER_STATE
+    distances, predecessors, weights, _, stats = run_dijkstra(
+        state['graph'], state['vertices'], state['index'], [state['index'][source]], queue
+    )
+    return source, distances, predecessors, weights, stats
+
+
+def dijkstra_many(graph, sources, workers: int = None, queue: str = "heap"):
+    """
+    Runs Dijkstra's algorithm from every source across a process pool.
+
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries.
+        sources (list): Start vertex keys.
+        workers (int): Number of worker processes (defaults to the CPU count).
+        queue (str): Priority queue to use, see make_queue.
+
+    Yields:
+        tuple: (source, ShortestPathTree) in the order the results finish.
+    """
+    vertices = list(graph)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        # Workers inherit the graph from this process without pickling it
+        _WORKER_STATE['graph'] = graph
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   mp_context=multiprocessing.get_context('fork'))
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(graph,))
+    try:
+        futures = [pool.submit(_solve_source, source, queue) for source in sources]
+        for future in as_completed(futures):
+            source, distances, predecessors, weights, stats = future.result()
+            yield source, ShortestPathTree(source, vertices, index, distances,
+                                           predecessors, weights, stats)
+    finally:
+        # Tasks not started yet are dropped if the caller stops iterating early
+        pool.shutdown(cancel_futures=True)
+        _WORKER_STATE.pop('graph', None)
+
+
+def benchmark(graph, sources, max_workers: int = None):
+    """
+    Prints the time to solve all sources sequentially and with 1..max_workers processes.
+    """
+    max_workers = max_workers or os.cpu_count()
+    started = time.perf_counter()
+    for source in sources:
+        dijkstra_tree(graph, source)
+    serial = time.perf_counter() - started
+    print(f"{'workers':>8} {'seconds':>9} {'speed-up':>9}")
+    print("-" * 28)
+    print(f"{'serial':>8} {serial:>9.3f} {1:>9.2f}")
+    for workers in range(1, max_workers + 1):
+        started = time.perf_counter()
+        for _ in dijkstra_many(graph, sources, workers):
+            pass
+        elapsed = time.perf_counter() - started
+        print(f"{workers:>8} {elapsed:>9.3f} {serial / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    from t_03_dijkstra_with_heap import graph_, nearest_facility, print_results
+
+    for start, tree in dijkstra_many(graph_, list(graph_), workers=2):
+        print(f"\nstart: {start}")
+        print_results(tree.rows())
+
+    tree, nearest = nearest_facility(graph_, ['A', 'E'])
+    print("\nnearest facility:", nearest)
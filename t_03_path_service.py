@@ -0,0 +1,217 @@
+"""
+Module for a cached shortest-path query service over a slowly changing graph.
+
+Shortest-path trees computed by dijkstra_tree are kept in an LRU cache
+bounded by memory. When an edge weight changes, only the cached trees
+that the change can affect are touched: a decrease is repaired in place
+by propagating the improvement from the edge head (dynamic SSSP), an
+increase drops only the trees that use the edge.
+"""
+from collections import OrderedDict
+import heapq
+import sys
+
+from t_03_dijkstra_with_heap import DijkstraRow, ShortestPathTree, run_dijkstra
+
+
+def tree_memory(tree: ShortestPathTree) -> int:
+    """
+    Estimates the memory held by the per-source arrays of a tree, in bytes.
+
+    The vertex list and index are shared by all trees of a
+    ShortestPathService and not counted; neither are the last edge weights,
+    which refer to the weight objects of the graph. Every reached vertex
+    has its own distance object, so those are added to the list sizes.
+    """
+    distance_objects = sum(map(_distance_size, tree.distances))
+    return (sys.getsizeof(tree.distances) + distance_objects
+            + sys.getsizeof(tree.predecessors) + sys.getsizeof(tree.weights))
+
+
+def _distance_size(distance) -> int:
+    """Bytes tree_memory counts for one distance object."""
+    return sys.getsizeof(distance) if distance != float('infinity') else 0
+
+
+def repair_decrease(tree: ShortestPathTree, graph, u, v, weight) -> tuple[bool, int]:
+    """
+    Updates a shortest-path tree in place after edge (u, v) got cheaper.
+
+    Only vertices whose distance actually improves are visited: the new
+    distance of v is propagated with a Dijkstra search that stops
+    relaxing wherever the old distances are already optimal.
+
+    Returns:
+        tuple: Whether any distance changed, and the resulting change of
+               tree_memory(tree) in bytes.
+    """
+    vertices, index = tree.vertices, tree.index
+    distances, predecessors, weights = tree.distances, tree.predecessors, tree.weights
+    u_idx, v_idx = index[u], index[v]
+    distance = distances[u_idx] + weight
+    if distance >= distances[v_idx]:
+        return False, 0
+
+    memory_delta = _distance_size(distance) - _distance_size(distances[v_idx])
+    distances[v_idx] = distance
+    predecessors[v_idx] = u_idx
+    weights[v_idx] = weight
+    priority_queue = [(distance, v_idx)]
+    while priority_queue:
+        current_cost, current = heapq.heappop(priority_queue)
+        if current_cost > distances[current]:
+            continue
+        for neighbor, edge_weight in graph[vertices[current]].items():
+            neighbor_idx = index[neighbor]
+            distance = current_cost + edge_weight
+            if distance < distances[neighbor_idx]:
+                memory_delta += _distance_size(distance) - _distance_size(distances[neighbor_idx])
+                distances[neighbor_idx] = distance
+                predecessors[neighbor_idx] = current
+                weights[neighbor_idx] = edge_weight
+                heapq.heappush(priority_queue, (distance, neighbor_idx))
+    return True, memory_delta
+
+
+class ShortestPathService:
+    """
+    Answers shortest-path queries from an LRU cache of shortest-path trees.
+
+    Args:
+        graph (dict): The graph represented as a dictionary of dictionaries;
+                      it is updated in place by update_edge/remove_edge.
+        max_memory (int): Upper bound on the estimated memory of all cached
+                          trees, in bytes.
+        queue (str): Priority queue used to build trees, see make_queue.
+    """
+    def __init__(self, graph, max_memory: int = 64 * 2 ** 20, queue: str = "heap"):
+        self.graph = graph
+        self.max_memory = max_memory
+        self.queue = queue
+        self.memory = 0
+        self._trees = OrderedDict()
+        self._number_vertices()
+        self.hits = 0
+        self.misses = 0
+        self.repairs = 0
+        self.invalidations = 0
+
+    def _number_vertices(self):
+        """
+        Numbers the vertices of the graph once for all trees built from now on.
+
+        New objects are created rather than extended in place, because the
+        cached trees keep referring to the numbering they were built with.
+        """
+        self._vertices = list(self.graph)
+        self._index = {vertex: i for i, vertex in enumerate(self._vertices)}
+
+    def stats(self) -> dict:
+        """Returns the cache counters and current memory use."""
+        return {'hits': self.hits, 'misses': self.misses, 'repairs': self.repairs,
+                'invalidations': self.invalidations, 'trees': len(self._trees),
+                'memory': self.memory}
+
+    def tree(self, source) -> ShortestPathTree:
+        """
+        Returns the shortest-path tree of source, computing it on a miss.
+        """
+        tree = self._trees.get(source)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(source)
+            return tree
+
+        self.misses += 1
+        distances, predecessors, weights, _, stats = run_dijkstra(
+            self.graph, self._vertices, self._index, [self._index[source]], self.queue
+        )
+        tree = ShortestPathTree(source, self._vertices, self._index, distances,
+                                predecessors, weights, stats)
+        self._trees[source] = tree
+        self.memory += tree_memory(tree)
+        self._evict()
+        return tree
+
+    def _evict(self):
+        """Drops least recently used trees until the memory bound holds."""
+        while self.memory > self.max_memory and len(self._trees) > 1:
+            _, evicted = self._trees.popitem(last=False)
+            self.memory -= tree_memory(evicted)
+
+    def query(self, source, target) -> DijkstraRow:
+        """
+        Returns the DijkstraRow of target for paths starting at source.
+        """
+        return self.tree(source).row(target)
+
+    def _drop(self, source):
+        """Removes a cached tree."""
+        self.memory -= tree_memory(self._trees.pop(source))
+        self.invalidations += 1
+
+    def update_edge(self, u, v, weight, symmetric: bool = False):
+        """
+        Sets the weight of edge (u, v), adding it if needed, and fixes the cache.
+
+        Args:
+            symmetric (bool): Also update (v, u), as in undirected graphs.
+        """
+        self._set_weight(u, v, weight)
+        if symmetric:
+            self._set_weight(v, u, weight)
+
+    def remove_edge(self, u, v, symmetric: bool = False):
+        """
+        Removes edge (u, v) and drops the cached trees that used it.
+        """
+        self._set_weight(u, v, None)
+        if symmetric:
+            self._set_weight(v, u, None)
+
+    def _set_weight(self, u, v, weight):
+        """
+        Applies one directed edge change to the graph and every cached tree.
+
+        weight None removes the edge.
+        """
+        old_weight = self.graph.get(u, {}).get(v, float('infinity'))
+        if weight is None and old_weight == float('infinity'):
+            return  # Removing an edge that does not exist changes nothing
+        if weight is None:
+            self.graph.get(u, {}).pop(v, None)
+        else:
+            self.graph.setdefault(u, {})[v] = weight
+            self.graph.setdefault(v, {})
+        new_weight = float('infinity') if weight is None else weight
+        if u not in self._index or v not in self._index:
+            self._number_vertices()
+
+        for source, tree in list(self._trees.items()):
+            if u not in tree.index or v not in tree.index:
+                # The graph gained vertices this tree does not know about
+                self._drop(source)
+            elif new_weight < old_weight:
+                changed, memory_delta = repair_decrease(tree, self.graph, u, v, new_weight)
+                if changed:
+                    self.repairs += 1
+                    self.memory += memory_delta
+            elif new_weight > old_weight \
+                    and tree.predecessors[tree.index[v]] == tree.index[u]:
+                # Only trees that route through (u, v) can get worse
+                self._drop(source)
+        # Repairs can reach vertices that were unreachable before
+        self._evict()
+
+
+if __name__ == "__main__":
+    from t_03_dijkstra_with_heap import graph_
+
+    service = ShortestPathService(graph_)
+    print(service.query('A', 'E'))
+    print(service.query('A', 'C'))
+    service.update_edge('A', 'C', 1, symmetric=True)
+    print(service.query('A', 'E'))
+    service.update_edge('D', 'F', 5, symmetric=True)
+    print(service.query('A', 'E'))
+    print(service.stats())
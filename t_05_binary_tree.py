@@ -0,0 +1,253 @@
+"""
+Module for binary trees and lazy traversals over them.
+
+A tree is either linked Node objects or an ArrayTree, which keeps the
+children, values and colors in parallel arrays indexed by integer node
+id; both can be built from a level-order list. The traverse_* generators
+walk either kind and need only the standard library and NumPy, so tree
+searches do not pay for the plotting stack of t_05_draw_btree_bfs_and_dfs.
+"""
+import itertools
+import operator
+from collections import deque, namedtuple
+
+import numpy as np
+
+# Source of the integer node ids
+_node_ids = itertools.count()
+
+# Child id that marks a missing child in an ArrayTree
+NIL = -1
+
+# One step of a traversal: the node handle (Node or ArrayTree id), its depth,
+# drawing coordinates and 1-based visit number
+Visit = namedtuple('Visit', ['node', 'depth', 'x', 'y', 'order'])
+
+
+class Node:
+    """
+    Represents a node in the binary tree.
+    """
+    __slots__ = ('left', 'right', 'val', 'color', 'id')
+
+    def __init__(self, key, color="skyblue"):
+        self.left = None
+        self.right = None
+        self.val = key
+        self.color = color # Додатковий аргумент для зберігання кольору вузла
+        self.id = next(_node_ids) # Унікальний цілочисельний ідентифікатор для кожного вузла
+
+
+def build_tree(values: list, color: str = "skyblue") -> Node:
+    """
+    Builds linked Nodes from a level-order list.
+
+    The children of values[i] are values[2 * i + 1] and values[2 * i + 2];
+    None marks a missing node, and everything below it is ignored.
+
+    Returns:
+        Node: The root, or None for an empty tree.
+    """
+    nodes = [None if value is None else Node(value, color) for value in values]
+    for i, node in enumerate(nodes[:len(nodes) // 2]):
+        if node is not None:
+            node.left = nodes[2 * i + 1]
+            if 2 * i + 2 < len(nodes):
+                node.right = nodes[2 * i + 2]
+    return nodes[0] if nodes else None
+
+
+class ArrayTree:
+    """
+    Represents a binary tree as parallel arrays indexed by integer node id.
+
+    left[i] and right[i] are the ids of the children of node i (NIL if
+    missing), val[i] and color[i] are its value and color.
+    """
+    def __init__(self, left: np.ndarray, right: np.ndarray, val: list, color: list = None,
+                 root: int = 0):
+        self.left = left
+        self.right = right
+        self.val = val
+        self.color = color if color is not None else ["skyblue"] * len(val)
+        self.root = root
+        self._lists = None
+
+    @classmethod
+    def from_level_order(cls, values: list, color: str = "skyblue") -> 'ArrayTree':
+        """
+        Builds the tree from a level-order list in one vectorized pass.
+
+        Uses the same layout as build_tree; node ids are the list positions.
+        """
+        size = len(values)
+        present = np.fromiter((value is not None for value in values), dtype=bool, count=size)
+        ids = np.arange(size, dtype=np.int64)
+        children = []
+        for child in (2 * ids + 1, 2 * ids + 2):
+            exists = child < size
+            exists[exists] = present[child[exists]]
+            children.append(np.where(exists, child, NIL))
+        root = 0 if size and present[0] else NIL
+        return cls(children[0], children[1], list(values), [color] * size, root)
+
+    def as_lists(self) -> tuple[list, list]:
+        """
+        Returns left and right as cached Python lists for pure-Python traversals.
+        """
+        if self._lists is None:
+            self._lists = (self.left.tolist(), self.right.tolist())
+        return self._lists
+
+
+def tree_view(tree):
+    """
+    Returns (root, children, value, node_id) for a Node or ArrayTree.
+
+    Nodes are handled as opaque handles: Node objects or integer ids.
+    children(handle) gives (left, right) with None for a missing child.
+    """
+    if isinstance(tree, ArrayTree):
+        left, right = tree.as_lists()
+
+        def children(node):
+            return (left[node] if left[node] != NIL else None,
+                    right[node] if right[node] != NIL else None)
+        return (tree.root if tree.root != NIL else None, children,
+                tree.val.__getitem__, int)
+    return tree, lambda node: (node.left, node.right), operator.attrgetter('val'), \
+        operator.attrgetter('id')
+
+def _child_positions(children, node, depth, x):
+    """
+    Returns [(child, child_x)] for the existing children of node, left first.
+    """
+    offset = 1 / 2 ** (depth + 1)
+    left, right = children(node)
+    return [(child, child_x) for child, child_x in ((left, x - offset), (right, x + offset))
+            if child is not None]
+
+
+def traverse_bfs(tree, max_depth: int = None):
+    """
+    Lazily yields a Visit for every node in breadth-first order.
+
+    Like every traversal here, it does only the work for the nodes actually
+    consumed, so a caller that stops iterating stops the traversal.
+
+    Args:
+        tree: The root Node or an ArrayTree.
+        max_depth (int): Do not descend below this depth.
+    """
+    root, children, _, _ = tree_view(tree)
+    if root is None:
+        return
+    queue = deque([(root, 0, 0.0)])
+    order = 0
+    while queue:
+        current, depth, x = queue.popleft()
+        order += 1
+        yield Visit(current, depth, x, -depth, order)
+        if max_depth is None or depth < max_depth:
+            for child, child_x in _child_positions(children, current, depth, x):
+                queue.append((child, depth + 1, child_x))
+
+
+def traverse_preorder(tree, max_depth: int = None, right_first: bool = False):
+    """
+    Lazily yields a Visit for every node in depth-first pre-order.
+
+    Args:
+        right_first (bool): Visit the right subtree before the left one,
+                            as the stack-based dfs_add_edges does.
+    """
+    root, children, _, _ = tree_view(tree)
+    if root is None:
+        return
+    stack = [(root, 0, 0.0)]
+    order = 0
+    while stack:
+        current, depth, x = stack.pop()
+        order += 1
+        yield Visit(current, depth, x, -depth, order)
+        if max_depth is None or depth < max_depth:
+            positions = _child_positions(children, current, depth, x)
+            stack.extend((child, depth + 1, child_x) for child, child_x in
+                         (positions if right_first else reversed(positions)))
+
+
+def traverse_inorder(tree, max_depth: int = None):
+    """
+    Lazily yields a Visit for every node in in-order (left, node, right).
+    """
+    root, children, _, _ = tree_view(tree)
+    order = 0
+    stack = []
+    current = (root, 0, 0.0) if root is not None else None
+    while stack or current:
+        while current:
+            stack.append(current)
+            node, depth, x = current
+            left, _ = children(node)
+            current = None
+            if left is not None and (max_depth is None or depth < max_depth):
+                current = (left, depth + 1, x - 1 / 2 ** (depth + 1))
+        node, depth, x = stack.pop()
+        order += 1
+        yield Visit(node, depth, x, -depth, order)
+        _, right = children(node)
+        if right is not None and (max_depth is None or depth < max_depth):
+            current = (right, depth + 1, x + 1 / 2 ** (depth + 1))
+
+
+def traverse_postorder(tree, max_depth: int = None):
+    """
+    Lazily yields a Visit for every node in post-order (left, right, node).
+    """
+    root, children, _, _ = tree_view(tree)
+    if root is None:
+        return
+    stack = [(root, 0, 0.0, False)]  # (node, depth, x, children_done)
+    order = 0
+    while stack:
+        current, depth, x, children_done = stack.pop()
+        if children_done or (max_depth is not None and depth >= max_depth):
+            order += 1
+            yield Visit(current, depth, x, -depth, order)
+            continue
+        stack.append((current, depth, x, True))
+        for child, child_x in reversed(_child_positions(children, current, depth, x)):
+            stack.append((child, depth + 1, child_x, False))
+
+
+def traverse_levels(tree, max_depth: int = None):
+    """
+    Lazily yields the Visits of each level as one list, top level first.
+    """
+    level = []
+    for visit in traverse_bfs(tree, max_depth):
+        if level and visit.depth != level[-1].depth:
+            yield level
+            level = []
+        level.append(visit)
+    if level:
+        yield level
+
+
+TRAVERSALS = {
+    'bfs': traverse_bfs,
+    'preorder': traverse_preorder,
+    'inorder': traverse_inorder,
+    'postorder': traverse_postorder,
+}
+
+
+def find_node(tree, predicate, traversal: str = 'bfs'):
+    """
+    Returns the first Visit whose node value satisfies predicate, or None.
+
+    The traversal stops at the first match.
+    """
+    _, _, value, _ = tree_view(tree)
+    return next((visit for visit in TRAVERSALS[traversal](tree)
+                 if predicate(value(visit.node))), None)
@@ -1,23 +1,58 @@
 """
 Module for visualizing binary tree traversals (BFS and DFS) using NetworkX and Matplotlib.
+
+The trees and the traverse_* generators live in t_05_binary_tree, which
+does not import any plotting library; the drawing functions here consume
+those generators and accept either Node or ArrayTree trees.
 """
-import uuid
 import colorsys
-from collections import deque
+import functools
+import os
+import shutil
+import subprocess
 
 import networkx as nx
+import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+from PIL import Image
+
+from t_05_binary_tree import (
+    TRAVERSALS, ArrayTree, Node, traverse_bfs, traverse_preorder, tree_view
+)
+
+# Start color and step of the traversal gradient
+GRADIENT_START = "#1712FF"
+GRADIENT_STEP = 30
+
+# Face color of nodes not visited yet in animations
+UNVISITED_COLOR = "#E0E0E0"
+# Node value labels are drawn in animations only up to this many nodes
+MAX_ANIMATION_LABELS = 64
+# Height in pixels of the strip above the tree reserved for the step counter
+COUNTER_HEIGHT = 24
+
 
-class Node:
+def _add_visits(graph, tree, pos, visits):
     """
-    Represents a node in the binary tree.
+    Adds the visited nodes and their edges to the graph with gradient colors.
     """
-    def __init__(self, key, color="skyblue"):
-        self.left = None
-        self.right = None
-        self.val = key
-        self.color = color # Додатковий аргумент для зберігання кольору вузла
-        self.id = str(uuid.uuid4()) # Унікальний ідентифікатор для кожного вузла
+    _, children, value, node_id = tree_view(tree)
+    visits = list(visits)
+    palette = gradient_palette(GRADIENT_START, GRADIENT_STEP, len(visits))
+    for visit, color in zip(visits, palette):
+        current = visit.node
+        graph.add_node(node_id(current), color=color, label=value(current), order=visit.order)
+        pos[node_id(current)] = (visit.x, visit.y)
+        for child in children(current):
+            if child is not None:
+                graph.add_edge(node_id(current), node_id(child))
+    return graph
+
 
 def get_color(color, step):
     """
@@ -40,64 +75,71 @@ def get_color(color, step):
     return new_color
 
 
+@functools.lru_cache(maxsize=32)
+def _gradient_cycle(start: str, step: int) -> tuple[np.ndarray, int]:
+    """
+    Returns the distinct colors of the get_color sequence from start and
+    the position where it starts repeating.
+
+    get_color rounds every color to hex, so it maps a finite set of 2**24
+    colors to itself and the sequence always ends in a cycle; for the
+    default start it enters a cycle of 76 colors after 198 steps.
+
+    Returns:
+        tuple: RGB floats of the distinct colors, shape (m, 3), and the
+               index in them that the color after the last one repeats.
+    """
+    colors, seen = [], {}
+    color = get_color(start, step)
+    while color not in seen:
+        seen[color] = len(colors)
+        colors.append(color)
+        color = get_color(color, step)
+    rgb = to_rgba_array(colors)[:, :3]
+    rgb.flags.writeable = False
+    return rgb, seen[color]
+
+
+def gradient_palette(start: str = GRADIENT_START, step: int = GRADIENT_STEP,
+                     n: int = 1) -> np.ndarray:
+    """
+    Returns the first n colors of the get_color gradient from start as RGB floats.
+
+    Only the prefix and cycle of the sequence are computed with get_color,
+    once per (start, step); the n-step palette is a single vectorized index
+    into them, so redraws of any size reuse the cached cycle.
+
+    Returns:
+        np.ndarray: Colors, shape (n, 3), ready for nx.draw or scatter.
+    """
+    rgb, cycle_start = _gradient_cycle(start, step)
+    indices = np.arange(n)
+    beyond = indices >= len(rgb)
+    indices[beyond] = cycle_start + (indices[beyond] - cycle_start) % (len(rgb) - cycle_start)
+    return rgb[indices]
+
+
 def bfs_add_edges(graph, node, pos):
     """
     Performs Breadth-First Search (BFS) to add edges and nodes to the graph
     for visualization.
     """
-    color = "#1712FF"
-    x, y, layer = 0, 0, 1
-    queue = deque([(node, x, y, layer)])
-    order = 0
-    while queue:  # Поки черга не порожня, продовжуємо обхід
-        current, x, y, layer = queue.popleft()
-        color = get_color(color, 30)
-        order += 1
-        graph.add_node(current.id, color=color, label=current.val, order=order)
-        if current.left:
-            graph.add_edge(current.id, current.left.id)
-            l = x - 1 / 2 ** layer
-            pos[current.left.id] = (l, y - 1)
-            queue.append((current.left, l, y - 1, layer + 1))
-        if current.right:
-            graph.add_edge(current.id, current.right.id)
-            r = x + 1 / 2 ** layer
-            pos[current.right.id] = (r, y - 1)
-            queue.append((current.right, r, y - 1, layer + 1))
-    return graph
+    return _add_visits(graph, node, pos, traverse_bfs(node))
 
 def dfs_add_edges(graph, node, pos):
     """
     Performs Depth-First Search (DFS) to add edges and nodes to the graph
     for visualization.
     """
-    color = "#1712FF"
-    x, y, layer = 0, 0, 1
-    stack = [(node, x, y, layer)]
-    order = 0
-    while stack:
-        current, x, y, layer = stack.pop()
-        color = get_color(color, 30)
-        order += 1
-        graph.add_node(current.id, color=color, label=current.val, order=order)
-        if current.left:
-            graph.add_edge(current.id, current.left.id)
-            l = x - 1 / 2 ** layer
-            pos[current.left.id] = (l, y - 1)
-            stack.append((current.left, l, y - 1, layer + 1))
-        if current.right:
-            graph.add_edge(current.id, current.right.id)
-            r = x + 1 / 2 ** layer
-            pos[current.right.id] = (r, y - 1)
-            stack.append((current.right, r, y - 1, layer + 1))
-    return graph
+    return _add_visits(graph, node, pos, traverse_preorder(node, right_first=True))
 
 def draw_tree(tree_root, add_edges_func):
     """
     Draws the binary tree using the specified traversal function to determine colors and order.
     """
+    root, _, _, node_id = tree_view(tree_root)
     tree = nx.DiGraph()
-    pos = {tree_root.id: (0, 0)}
+    pos = {node_id(root): (0, 0)}
     tree = add_edges_func(tree, tree_root, pos)
 
     colors = [node[1]['color'] for node in tree.nodes(data=True)]
@@ -136,14 +178,140 @@ def draw_tree(tree_root, add_edges_func):
     plt.show()
 
 
-# Створення дерева
-root = Node(0)
-root.left = Node(4)
-root.left.left = Node(5)
-root.left.right = Node(10)
-root.right = Node(1)
-root.right.left = Node(3)
+def _write_gif(path, frames, fps):
+    """Saves RGBA frames as a looping GIF."""
+    images = [Image.fromarray(frame).convert('RGB').quantize(method=Image.Quantize.FASTOCTREE)
+              for frame in frames]
+    images[0].save(path, save_all=True, append_images=images[1:],
+                   duration=round(1000 / fps), loop=0)
+
+
+def _write_mp4(path, frames, fps, width, height):
+    """Pipes RGBA frames into ffmpeg as raw video."""
+    ffmpeg = shutil.which(matplotlib.rcParams['animation.ffmpeg_path'])
+    if ffmpeg is None:
+        raise RuntimeError("MP4 export requires ffmpeg to be installed")
+    command = [ffmpeg, '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+               '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+               '-pix_fmt', 'yuv420p', '-vcodec', 'libx264', path]
+    with subprocess.Popen(command, stdin=subprocess.PIPE) as process:
+        for frame in frames:
+            process.stdin.write(frame.tobytes())
+        process.stdin.close()
+        if process.wait():
+            raise RuntimeError(f"ffmpeg exited with code {process.returncode}")
+
+
+def animate_traversal(tree, path: str, traversal: str = 'bfs', max_frames: int = 200,
+                      fps: int = 10, size: tuple = (800, 500)):
+    """
+    Exports the visit sequence of a traversal as a GIF or MP4 animation.
+
+    The edges, the unvisited nodes and (for small trees) the value labels
+    are rendered once. Each frame then blits only the nodes visited since
+    the previous frame, drawn in their gradient face colors, and the step
+    counter, so the cost per frame does not grow with the tree. Large
+    traversals reveal several nodes per frame to stay within max_frames.
+
+    Args:
+        tree: The root Node or an ArrayTree.
+        path (str): Output file; the extension selects GIF or MP4 (needs ffmpeg).
+        traversal (str): One of TRAVERSALS.
+        max_frames (int): Upper bound on the number of frames.
+        fps (int): Frames per second.
+        size (tuple): Frame width and height in pixels (even for MP4).
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in ('.gif', '.mp4'):
+        raise ValueError(f"Unknown animation format: {extension}")
+    if traversal == 'dfs':
+        visits = list(traverse_preorder(tree, right_first=True))
+    else:
+        visits = list(TRAVERSALS[traversal](tree))
+    if not visits:
+        raise ValueError("cannot animate an empty tree")
+
+    _, children, value, node_id = tree_view(tree)
+    positions = np.array([(visit.x, visit.y) for visit in visits])
+    slot = {node_id(visit.node): i for i, visit in enumerate(visits)}
+    edges = [(slot[node_id(visit.node)], slot[node_id(child)])
+             for visit in visits for child in children(visit.node)
+             if child is not None and node_id(child) in slot]
+
+    width, height = size
+    fig = Figure(figsize=(width / 100, height / 100), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    # The step counter gets its own strip above the tree, so restoring its
+    # background never touches a node
+    strip = COUNTER_HEIGHT / height
+    ax = fig.add_axes((0, 0, 1, 1 - strip))
+    ax.axis('off')
+    counter_ax = fig.add_axes((0, 1 - strip, 1, strip))
+    counter_ax.axis('off')
+    if edges:
+        ax.add_collection(LineCollection(positions[np.array(edges)], colors="gray",
+                                         linewidths=0.5))
+    node_size = min(400, 40000 / len(visits))
+    ax.scatter(positions[:, 0], positions[:, 1], s=node_size, c=UNVISITED_COLOR, linewidths=0)
+    labels = []
+    if len(visits) <= MAX_ANIMATION_LABELS:
+        labels = [ax.annotate(str(value(visit.node)), xy, ha='center', va='center',
+                              fontsize=8, zorder=3)
+                  for visit, xy in zip(visits, positions)]
+    # Newly visited nodes are drawn on top of the unvisited ones, below the labels
+    visited = ax.scatter([], [], s=node_size, linewidths=0, animated=True, zorder=2)
+    step_text = counter_ax.text(0.01, 0.5, "", transform=counter_ax.transAxes, va='center',
+                                animated=True)
+    # Pad the limits by the marker radius (plus antialiasing) so edge nodes are not clipped
+    radius = np.sqrt(node_size) / 2 * fig.dpi / 72 + 2
+    for set_lim, coords, pixels in ((ax.set_xlim, positions[:, 0], width),
+                                    (ax.set_ylim, positions[:, 1], height - COUNTER_HEIGHT)):
+        low, high = coords.min(), coords.max()
+        pad = radius * ((high - low) or 1) / max(pixels - 2 * radius, 1)
+        set_lim(low - pad, high + pad)
+
+    canvas.draw()
+    counter_background = canvas.copy_from_bbox(counter_ax.bbox)
+    palette = gradient_palette(GRADIENT_START, GRADIENT_STEP, len(visits))
+
+    def frames():
+        per_frame = -(-len(visits) // max_frames)
+        for start in range(0, len(visits), per_frame):
+            stop = min(start + per_frame, len(visits))
+            # Earlier visits stay on the canvas; only the new batch is drawn
+            visited.set_offsets(positions[start:stop])
+            visited.set_facecolors(palette[start:stop])
+            ax.draw_artist(visited)
+            for label in labels[start:stop]:
+                ax.draw_artist(label)
+            canvas.restore_region(counter_background)
+            step_text.set_text(f"крок: {stop}")
+            counter_ax.draw_artist(step_text)
+            canvas.blit(fig.bbox)
+            yield np.asarray(canvas.buffer_rgba())
+
+    if extension == '.gif':
+        _write_gif(path, (frame.copy() for frame in frames()), fps)
+    else:
+        _write_mp4(path, frames(), fps, width, height)
+
+
+if __name__ == "__main__":
+    # Створення дерева
+    root = Node(0)
+    root.left = Node(4)
+    root.left.left = Node(5)
+    root.left.right = Node(10)
+    root.right = Node(1)
+    root.right.left = Node(3)
+
+    # Відображення дерева
+    draw_tree(root, bfs_add_edges)
+    draw_tree(root, dfs_add_edges)
+
+    # Те саме дерево у компактному вигляді
+    draw_tree(ArrayTree.from_level_order([0, 4, 1, 5, 10, 3]), bfs_add_edges)
 
-# Відображення дерева
-draw_tree(root, bfs_add_edges)
-draw_tree(root, dfs_add_edges)
+    # Анімація обходу
+    animate_traversal(root, "bfs.gif", 'bfs')
+    animate_traversal(root, "dfs.gif", 'dfs')
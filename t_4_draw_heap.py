@@ -2,26 +2,59 @@
 Module for visualizing a binary heap.
 
 This module provides functions to visualize a binary heap both as a tree printed to the console
-and as a graphical tree using NetworkX and Matplotlib.
+and as a graphical tree using NetworkX and Matplotlib. The console views are generators, so
+huge heaps can be streamed to a file with write_heap. Heaps larger than LARGE_HEAP_THRESHOLD
+are drawn by draw_heap, which computes node positions in closed form from the array index
+instead of building a NetworkX graph. The heaps themselves come from t_4_heap.Heap.
 """
-import heapq
+import sys
 
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
-def print_heap_iterative(heap: list):
-    """Ітеративна візуалізація купи, представленої списком (праворуч→вузол→ліворуч)."""
+from t_4_heap import Heap
+
+# Heaps with more elements than this are drawn by draw_heap
+LARGE_HEAP_THRESHOLD = 127
+# Node labels are drawn only up to this many nodes
+MAX_HEAP_LABELS = 255
+# Marker for the part of a heap cut off by the console renderers
+ELISION = "…"
+
+def iter_heap_lines(heap: list, max_depth: int = None, max_nodes: int = None,
+                    elision: str = ELISION):
+    """
+    Lazily yields the lines of the tree view printed by print_heap_iterative.
+
+    The traversal stack holds at most two entries per level, so memory stays
+    O(depth) however large the heap is.
+
+    Args:
+        heap (list): The list representing the heap.
+        max_depth (int): Deepest level to show; hidden subtrees are marked
+                         with an elision line.
+        max_nodes (int): Stop after this many nodes with an elision line.
+        elision (str): Marker for the omitted part of the tree.
+
+    Yields:
+        str: Lines without a trailing newline.
+    """
     if not heap:
-        print("(порожня купа)")
+        yield "(порожня купа)"
         return
 
     def has_idx(idx):
         return 0 <= idx < len(heap) and heap[idx] is not None
 
-    stack = [(0, "", False, True, False)]  # (idx, prefix, is_left, is_root, processed)
+    emitted = 0
+    stack = [(0, "", False, True, False, 0)]  # (idx, prefix, is_left, is_root, processed, depth)
 
     while stack:
-        idx, prefix, is_left, is_root, processed = stack.pop()
+        idx, prefix, is_left, is_root, processed, depth = stack.pop()
         if not has_idx(idx):
             continue
 
@@ -29,28 +62,98 @@ def print_heap_iterative(heap: list):
         right_idx = 2 * idx + 2
         has_left = has_idx(left_idx)
         has_right = has_idx(right_idx)
+        if is_root:
+            right_prefix = ""
+            left_prefix = ""
+        else:
+            right_prefix = prefix + ("│   " if is_left else "    ")
+            left_prefix = prefix + ("    " if is_left else "│   ")
+        expand = max_depth is None or depth < max_depth
 
         if processed:
+            if max_nodes is not None and emitted >= max_nodes:
+                yield elision
+                return
+            emitted += 1
             if is_root:
-                print(heap[idx])
+                yield str(heap[idx])
             else:
                 connector = "└── " if is_left else "┌── "
-                print(prefix + connector + str(heap[idx]))
+                yield prefix + connector + str(heap[idx])
+            if not expand and (has_left or has_right):
+                yield left_prefix + "└── " + elision
         else:
-            if is_root:
-                right_prefix = ""
-                left_prefix = ""
-            else:
-                right_prefix = prefix + ("│   " if is_left else "    ")
-                left_prefix = prefix + ("    " if is_left else "│   ")
+            if has_left and expand:
+                stack.append((left_idx, left_prefix, True, False, False, depth + 1))
+
+            stack.append((idx, prefix, is_left, is_root, True, depth))
+
+            if has_right and expand:
+                stack.append((right_idx, right_prefix, False, False, False, depth + 1))
+
+
+def iter_heap_levels(heap: list, max_depth: int = None, max_nodes: int = None,
+                     width: int = 16, elision: str = ELISION):
+    """
+    Lazily yields a compact level-order view: one level per line, "depth: values".
+
+    Levels wider than width values are wrapped onto indented continuation
+    lines, so no line grows with the heap size.
+
+    Args:
+        heap (list): The list representing the heap.
+        max_depth (int): Deepest level to show.
+        max_nodes (int): Stop after this many values.
+        width (int): Values per line.
+        elision (str): Marker for the omitted part of the heap.
+
+    Yields:
+        str: Lines without a trailing newline.
+    """
+    if not heap:
+        yield "(порожня купа)"
+        return
+
+    last_depth = (len(heap)).bit_length() - 1
+    limit = len(heap) if max_nodes is None else min(len(heap), max_nodes)
+    label_width = len(str(last_depth)) + 2
+    depth, start = 0, 0
+    while start < limit and (max_depth is None or depth <= max_depth):
+        stop = min(2 * start + 1, limit)
+        for chunk in range(start, stop, width):
+            label = f"{depth}: " if chunk == start else ""
+            values = " ".join(str(value) for value in heap[chunk:min(chunk + width, stop)])
+            yield label.rjust(label_width) + values
+        depth, start = depth + 1, 2 * start + 1
+    if start < len(heap):
+        yield elision
+
+
+def write_heap(heap: list, file=None, fmt: str = "tree", buffer_size: int = 2 ** 16, **limits):
+    """
+    Writes a heap view to a file through a buffered writer.
 
-            if has_left:
-                stack.append((left_idx, left_prefix, True, False, False))
+    Args:
+        heap (list): The list representing the heap.
+        file: A path or a text file object (defaults to sys.stdout).
+        fmt (str): "tree" for iter_heap_lines or "levels" for iter_heap_levels.
+        buffer_size (int): Buffer size used when file is a path.
+        **limits: max_depth, max_nodes, elision (and width for "levels").
+    """
+    renderers = {"tree": iter_heap_lines, "levels": iter_heap_levels}
+    if fmt not in renderers:
+        raise ValueError(f"Unknown format: {fmt}")
+    lines = (line + "\n" for line in renderers[fmt](heap, **limits))
+    if isinstance(file, str):
+        with open(file, "w", encoding="utf-8", buffering=buffer_size) as output:
+            output.writelines(lines)
+    else:
+        (file or sys.stdout).writelines(lines)
 
-            stack.append((idx, prefix, is_left, is_root, True))
 
-            if has_right:
-                stack.append((right_idx, right_prefix, False, False, False))
+def print_heap_iterative(heap: list):
+    """Ітеративна візуалізація купи, представленої списком (праворуч→вузол→ліворуч)."""
+    write_heap(heap)
 
 def add_edges(graph, heap, pos, idx=0, x=0, y=0, layer=1):
     """
@@ -88,12 +191,96 @@ def add_edges(graph, heap, pos, idx=0, x=0, y=0, layer=1):
 
 
 
+def heap_positions(size: int) -> np.ndarray:
+    """
+    Computes the drawing positions of heap indices 0..size-1 in one vectorized pass.
+
+    Index i lies at depth d = floor(log2(i + 1)) with offset k = i + 1 - 2**d
+    within its level, which gives the same layout as add_edges:
+    x = (2k + 1) / 2**d - 1, y = -d.
+
+    Returns:
+        np.ndarray: Positions, shape (size, 2).
+    """
+    numbers = np.arange(1, size + 1)
+    depths = np.frexp(numbers)[1] - 1  # exact floor(log2) for integers
+    offsets = numbers - (1 << depths)
+    positions = np.empty((size, 2))
+    positions[:, 0] = np.ldexp(2 * offsets + 1, -depths) - 1
+    positions[:, 1] = -depths
+    return positions
+
+
+def heap_present(heap: list) -> np.ndarray:
+    """
+    Returns a boolean mask of the heap indices that are drawn.
+
+    As in add_edges, a None element hides itself and its whole subtree.
+    """
+    present = np.fromiter((value is not None for value in heap), dtype=bool, count=len(heap))
+    start = 1
+    while start < len(heap):
+        # Level by level: a node is shown only if its parent is
+        stop = min(2 * start + 1, len(heap))
+        children = np.arange(start, stop)
+        present[start:stop] &= present[(children - 1) // 2]
+        start = stop
+    return present
+
+
+def draw_heap(heap: list, path: str = None, max_labels: int = MAX_HEAP_LABELS):
+    """
+    Draws a heap with one scatter and one LineCollection, without NetworkX.
+
+    Args:
+        heap (list): The list representing the heap.
+        path (str): Save the image to this file instead of showing it.
+        max_labels (int): Draw node labels only for heaps up to this size.
+    """
+    if not heap:
+        print("(порожня купа)")
+        return
+
+    positions = heap_positions(len(heap))
+    present = heap_present(heap)
+    nodes = np.flatnonzero(present)
+    children = nodes[1:] if present[0] else nodes
+    parents = (children - 1) // 2
+
+    if path:
+        fig = Figure(figsize=(8, 5))
+        FigureCanvasAgg(fig)
+    else:
+        fig = plt.figure(figsize=(8, 5))
+    ax = fig.add_subplot()
+    ax.axis('off')
+    ax.add_collection(LineCollection(np.stack((positions[parents], positions[children]), axis=1),
+                                     colors="black", linewidths=0.5, zorder=1))
+    # Shrink the markers as the levels get wider
+    node_size = min(2500, 40000 / max(1, len(heap)))
+    ax.scatter(positions[nodes, 0], positions[nodes, 1], s=node_size, c="skyblue",
+               linewidths=0, zorder=2)
+    if len(heap) <= max_labels:
+        for node in nodes:
+            ax.annotate(str(heap[node]), positions[node], ha='center', va='center', zorder=3)
+    ax.autoscale_view()
+
+    if path:
+        fig.savefig(path)
+    else:
+        plt.show()
+
+
 def draw_tree(heap: list):
     """Візуалізація купи, представленої списком."""
     if not heap:
         print("(порожня купа)")
         return
 
+    if len(heap) > LARGE_HEAP_THRESHOLD:
+        draw_heap(heap)
+        return
+
     tree = nx.DiGraph()
     pos = {0: (0, 0)}
     tree = add_edges(tree, heap, pos)
@@ -105,9 +292,9 @@ def draw_tree(heap: list):
     plt.show()
 
 
-nums = [4, 10, 3, 5, 1, 10, 3, 7, 332, 4, 2, 6, 8, 9]
-heapq.heapify(nums)
-print("Список після heapify:", nums)
-print("Візуалізація купи:")
-print_heap_iterative(nums)
-draw_tree(nums)
+if __name__ == "__main__":
+    nums = Heap([4, 10, 3, 5, 1, 10, 3, 7, 332, 4, 2, 6, 8, 9]).to_list()
+    print("Список після heapify:", nums)
+    print("Візуалізація купи:")
+    print_heap_iterative(nums)
+    draw_tree(nums)
@@ -0,0 +1,296 @@
+"""
+Module for a d-ary priority queue that t_4_draw_heap can visualize.
+
+Items live in a flat list in heap order; child j of position i is at
+arity * i + j + 1. When a key function is given, the keys are computed
+once per item and kept in a parallel list, so comparisons never call it
+again. A binary min-heap without a key is delegated to the C heapq
+functions, which share the same layout.
+"""
+import argparse
+import heapq
+import operator
+import random
+import time
+
+
+class Heap:
+    """
+    Represents a d-ary min- or max-heap with an optional key function.
+
+    Args:
+        data (iterable): Initial items, heapified in O(n).
+        arity (int): Number of children per node.
+        key (callable): Function giving the comparison key of an item.
+        max_heap (bool): Pop the largest key first instead of the smallest.
+    """
+    def __init__(self, data=None, arity: int = 2, key=None, max_heap: bool = False):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self.key = key
+        self.max_heap = max_heap
+        self._before = operator.gt if max_heap else operator.lt
+        # heapq implements exactly the binary min-heap without keys
+        self._native = arity == 2 and key is None and not max_heap
+        self._items = list(data) if data is not None else []
+        self._keys = self._items if key is None else [key(item) for item in self._items]
+        self.heapify()
+
+    def __len__(self):
+        """
+        Return the number of items in the heap.
+        """
+        return len(self._items)
+
+    def __iter__(self):
+        """
+        Iterate over the items in array (heap) order.
+        """
+        return iter(self._items)
+
+    def to_list(self) -> list:
+        """
+        Return a copy of the items in array order.
+
+        For arity 2 the result can be passed to print_heap_iterative and
+        draw_tree from t_4_draw_heap.
+        """
+        return list(self._items)
+
+    def peek(self):
+        """
+        Return the top item without removing it.
+        """
+        if not self._items:
+            raise IndexError("peek from an empty heap")
+        return self._items[0]
+
+    def heapify(self):
+        """
+        Restore the heap property over the whole array in O(n).
+        """
+        if self._native:
+            heapq.heapify(self._items)
+            return
+        for pos in reversed(range((len(self._items) - 2) // self.arity + 1)):
+            self._sift_down(pos)
+
+    def _sift_up(self, pos: int):
+        """
+        Move the entry at pos towards the root until its parent is not after it.
+        """
+        keys, items, before, arity = self._keys, self._items, self._before, self.arity
+        key, item = keys[pos], items[pos]
+        while pos > 0:
+            parent = (pos - 1) // arity
+            if not before(key, keys[parent]):
+                break
+            keys[pos] = keys[parent]
+            items[pos] = items[parent]
+            pos = parent
+        keys[pos] = key
+        items[pos] = item
+
+    def _sift_down(self, pos: int):
+        """
+        Move the entry at pos towards the leaves until no child comes before it.
+        """
+        keys, items, before, arity = self._keys, self._items, self._before, self.arity
+        size = len(items)
+        key, item = keys[pos], items[pos]
+        while True:
+            first = arity * pos + 1
+            if first >= size:
+                break
+            best = first
+            for child in range(first + 1, min(first + arity, size)):
+                if before(keys[child], keys[best]):
+                    best = child
+            if not before(keys[best], key):
+                break
+            keys[pos] = keys[best]
+            items[pos] = items[best]
+            pos = best
+        keys[pos] = key
+        items[pos] = item
+
+    def push(self, item):
+        """
+        Add an item to the heap.
+        """
+        if self._native:
+            heapq.heappush(self._items, item)
+            return
+        self._items.append(item)
+        if self.key is not None:
+            self._keys.append(self.key(item))
+        self._sift_up(len(self._items) - 1)
+
+    def pop(self):
+        """
+        Remove and return the top item.
+        """
+        if not self._items:
+            raise IndexError("pop from an empty heap")
+        if self._native:
+            return heapq.heappop(self._items)
+        last_item = self._items.pop()
+        last_key = self._keys.pop() if self.key is not None else last_item
+        if not self._items:
+            return last_item
+        top = self._items[0]
+        self._items[0] = last_item
+        self._keys[0] = last_key
+        self._sift_down(0)
+        return top
+
+    def replace(self, item):
+        """
+        Pop the top item and push item in one sift; the result may not be item.
+        """
+        if not self._items:
+            raise IndexError("replace on an empty heap")
+        if self._native:
+            return heapq.heapreplace(self._items, item)
+        top = self._items[0]
+        self._items[0] = item
+        if self.key is not None:
+            self._keys[0] = self.key(item)
+        self._sift_down(0)
+        return top
+
+    def pushpop(self, item):
+        """
+        Push item and pop the top item in one sift; returns item itself if it comes first.
+        """
+        if self._native:
+            return heapq.heappushpop(self._items, item)
+        key = item if self.key is None else self.key(item)
+        if not self._items or not self._before(self._keys[0], key):
+            return item
+        top = self._items[0]
+        self._items[0] = item
+        self._keys[0] = key
+        self._sift_down(0)
+        return top
+
+    def push_many(self, items):
+        """
+        Add many items, re-heapifying in O(n + k) when that beats k sifts.
+        """
+        items = list(items)
+        if len(items) * max(1, len(self._items).bit_length()) < len(self._items) + len(items):
+            for item in items:
+                self.push(item)
+            return
+        self._items.extend(items)
+        if self.key is not None:
+            self._keys.extend(map(self.key, items))
+        self.heapify()
+
+    def pop_many(self, count: int) -> list:
+        """
+        Remove and return up to count top items in pop order.
+
+        Popping everything is done with one sort instead of repeated sifts.
+        """
+        if count >= len(self._items):
+            if self.key is None:
+                result = sorted(self._items, reverse=self.max_heap)
+            else:
+                order = sorted(range(len(self._items)), key=self._keys.__getitem__,
+                               reverse=self.max_heap)
+                result = [self._items[i] for i in order]
+            self._items.clear()
+            if self.key is not None:
+                self._keys.clear()
+            return result
+        return [self.pop() for _ in range(count)]
+
+    def merge(self, other: 'Heap'):
+        """
+        Move all items of other into this heap in O(n + m); other is left empty.
+
+        Both heaps must order items the same way; the arity may differ.
+        """
+        if other is self:
+            raise ValueError("cannot merge a heap into itself")
+        if other.key is not self.key or other.max_heap != self.max_heap:
+            raise ValueError("cannot merge heaps with different orderings")
+        self._items.extend(other._items)
+        if self.key is not None:
+            self._keys.extend(other._keys)
+        self.heapify()
+        other._items.clear()
+        if other.key is not None:
+            other._keys.clear()
+
+
+def _run_heapq(values: list, operations: int):
+    """
+    Runs the benchmark workload on a plain list with heapq.
+    """
+    heap = list(values)
+    heapq.heapify(heap)
+    for value in values[:operations]:
+        heapq.heappush(heap, value)
+    for _ in range(operations):
+        heapq.heappop(heap)
+
+
+def _run_heap(values: list, operations: int, **options):
+    """
+    Runs the benchmark workload on a Heap.
+    """
+    heap = Heap(values, **options)
+    for value in values[:operations]:
+        heap.push(value)
+    for _ in range(operations):
+        heap.pop()
+
+
+def benchmark(sizes=(10 ** 5, 10 ** 6, 10 ** 7), arities=(2, 4, 8), operations: int = 10 ** 5):
+    """
+    Compares heapify plus pushes and pops on Heap variants against heapq.
+    """
+    variants = {'heapq': _run_heapq, 'Heap()': _run_heap}
+    for arity in arities:
+        variants[f'Heap(arity={arity}, max)'] = \
+            lambda values, count, arity=arity: _run_heap(values, count, arity=arity,
+                                                         max_heap=True)
+    print(f"{'size':>10} {'variant':<22} {'seconds':>9}")
+    print("-" * 43)
+    for size in sizes:
+        values = [random.random() for _ in range(size)]
+        # A heap smaller than operations cannot serve that many pushes and pops
+        count = min(operations, size)
+        for name, run in variants.items():
+            started = time.perf_counter()
+            run(values, count)
+            print(f"{size:>10} {name:<22} {time.perf_counter() - started:>9.3f}")
+
+
+def main(argv=None):
+    """
+    Runs the demo, and with --benchmark also the comparison with heapq.
+    """
+    parser = argparse.ArgumentParser(description="d-ary heap demo.")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="compare Heap variants with heapq")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 5, 10 ** 6, 10 ** 7],
+                        help="heap sizes for --benchmark")
+    args = parser.parse_args(argv)
+
+    tasks = Heap([(3, 'read'), (1, 'write'), (2, 'test')], arity=4,
+                 key=operator.itemgetter(0), max_heap=True)
+    tasks.push((5, 'deploy'))
+    print("Задачі за пріоритетом:", tasks.pop_many(len(tasks)))
+
+    if args.benchmark:
+        print("\nПорівняння з heapq:")
+        benchmark(args.sizes)
+
+
+if __name__ == "__main__":
+    main()